@@ -1,3 +1,12 @@
-from opencuff.server import mcp
+from opencuff._version import __version__
 
-__all__ = ["mcp"]
+__all__ = ["__version__", "mcp"]
+
+
+def __getattr__(name: str):
+    """Lazy import of the server so the CLI doesn't load FastMCP on startup."""
+    if name == "mcp":
+        from opencuff.server import mcp
+
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
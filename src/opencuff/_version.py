@@ -0,0 +1,7 @@
+"""OpenCuff version.
+
+Kept as a constant so the CLI can report its version without scanning
+installed distribution metadata. Must match `version` in pyproject.toml.
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,207 @@
+"""Persistent cache for plugin discovery results.
+
+Running discovery walks the project directory and parses Makefiles,
+package.json and scripts. Repeated `cuff init` runs against an unchanged
+project redo all of that work, so the results are stored as JSON in the user
+cache directory and reused while the directory looks the same.
+
+A directory's mtime only changes when entries are added or removed, not when
+an existing file is edited. The cache is therefore validated against a
+fingerprint of (name, mtime_ns, size) for every top-level entry and for the
+entries of each top-level subdirectory, which covers everything the built-in
+plugins inspect during discovery.
+
+Like the settings parse cache, this cache is bypassed when OPENCUFF_NO_CACHE
+is set.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from opencuff import __version__
+from opencuff.cli._yaml_cache import _cache_dir, _cache_enabled
+from opencuff.plugins.base import DiscoveryResult
+
+if TYPE_CHECKING:
+    from opencuff.cli.discovery import DiscoveryCoordinator
+
+# Field names of DiscoveryResult, resolved once for serialization
+_RESULT_FIELDS = tuple(f.name for f in dataclasses.fields(DiscoveryResult))
+
+# Fields stored as tuples, which JSON round-trips as lists
+_TUPLE_FIELDS = ("warnings", "discovered_items")
+
+# Bump when the cache file layout changes
+_CACHE_FORMAT_VERSION = 1
+
+
+def _stat_entry(entry: os.DirEntry[str], name: str) -> list[str | int]:
+    """Return the fingerprint row for a directory entry.
+
+    Falls back to the link itself for dangling symlinks.
+
+    Args:
+        entry: The directory entry to stat.
+        name: Name to record for the entry.
+
+    Returns:
+        [name, mtime_ns, size] for the entry.
+    """
+    try:
+        st = entry.stat()
+    except OSError:
+        st = entry.stat(follow_symlinks=False)
+    return [name, st.st_mtime_ns, st.st_size]
+
+
+def _fingerprint(directory: Path) -> list[list[str | int]]:
+    """Build a stat fingerprint of a directory and its direct subdirectories.
+
+    Args:
+        directory: The directory being discovered.
+
+    Returns:
+        Sorted list of [relative name, mtime_ns, size] entries.
+    """
+    entries: list[list[str | int]] = []
+    with os.scandir(directory) as top:
+        for entry in top:
+            entries.append(_stat_entry(entry, entry.name))
+            if not entry.is_dir():
+                continue
+            try:
+                with os.scandir(entry.path) as sub:
+                    entries.extend(
+                        _stat_entry(child, f"{entry.name}/{child.name}")
+                        for child in sub
+                    )
+            except OSError:
+                continue
+    entries.sort()
+    return entries
+
+
+def _result_to_dict(result: DiscoveryResult) -> dict[str, object]:
+    """Convert a DiscoveryResult to a dict for JSON serialization.
+
+    Unlike dataclasses.asdict(), this neither re-reads the dataclass fields
+    nor deep-copies values, which json.dumps() doesn't need.
+
+    Args:
+        result: The discovery result to convert.
+
+    Returns:
+        Mapping of field names to values.
+    """
+    return {name: getattr(result, name) for name in _RESULT_FIELDS}
+
+
+def _result_from_dict(fields: dict[str, object]) -> DiscoveryResult:
+    """Rebuild a DiscoveryResult from its cached JSON form.
+
+    JSON has no tuple type, so the tuple fields come back as lists and are
+    converted here.
+
+    Args:
+        fields: Mapping of field names to values, as read from the cache.
+
+    Returns:
+        The discovery result.
+    """
+    for name in _TUPLE_FIELDS:
+        if name in fields:
+            fields[name] = tuple(fields[name])
+    return DiscoveryResult(**fields)
+
+
+def _cache_path_for(directory: Path, plugins: dict[str, str]) -> Path:
+    """Return the cache file path for a directory and set of plugins.
+
+    The key includes the opencuff version and cache format version, so an
+    upgrade that changes discovery logic never reuses older results.
+
+    Args:
+        directory: The directory being discovered.
+        plugins: Mapping of plugin names to their class paths.
+
+    Returns:
+        Path to the JSON cache file.
+    """
+    key_source = json.dumps(
+        [
+            _CACHE_FORMAT_VERSION,
+            __version__,
+            str(directory.resolve()),
+            sorted(plugins.items()),
+        ]
+    )
+    key = hashlib.sha256(key_source.encode()).hexdigest()
+    return _cache_dir() / f"discovery-{key}.json"
+
+
+def load_or_discover(
+    coordinator: "DiscoveryCoordinator",
+    directory: Path,
+    use_cache: bool = True,
+) -> dict[str, DiscoveryResult]:
+    """Run discovery for a directory, reusing cached results when valid.
+
+    Cache read/write failures are silently ignored and fall back to running
+    discovery directly. When OPENCUFF_NO_CACHE is set, the cache is neither
+    read nor written.
+
+    Args:
+        coordinator: The discovery coordinator to run on a cache miss.
+        directory: The directory to scan for plugin applicability.
+        use_cache: Whether to read the cache. Fresh results are always stored.
+
+    Returns:
+        Mapping of plugin names to their DiscoveryResult objects.
+
+    Raises:
+        ValueError: If directory does not exist or is not a directory.
+    """
+    if not _cache_enabled():
+        return coordinator.discover_all(directory)
+
+    plugins = {
+        name: f"{plugin_cls.__module__}.{plugin_cls.__qualname__}"
+        for name, plugin_cls in coordinator.plugins.items()
+    }
+
+    try:
+        cache_path = _cache_path_for(directory, plugins)
+        fingerprint = _fingerprint(directory)
+    except OSError:
+        return coordinator.discover_all(directory)
+
+    if use_cache:
+        try:
+            cached = json.loads(cache_path.read_text())
+            if cached["fingerprint"] == fingerprint:
+                return {
+                    name: _result_from_dict(fields)
+                    for name, fields in cached["results"].items()
+                }
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    results = coordinator.discover_all(directory)
+
+    try:
+        payload = {
+            "fingerprint": fingerprint,
+            "results": {
+                name: _result_to_dict(result) for name, result in results.items()
+            },
+        }
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(payload))
+    except (OSError, TypeError, ValueError):
+        pass
+
+    return results
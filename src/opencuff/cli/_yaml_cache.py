@@ -0,0 +1,124 @@
+"""Parse cache for YAML settings files.
+
+PyYAML parsing is slow compared to JSON decoding, and the CLI re-parses the
+same settings.yml on every `cuff status` / `cuff doctor` invocation. This module
+stores the parsed document as a JSON sidecar file in the user cache directory,
+keyed by the settings file path and validated against its mtime and size.
+
+The cache file layout is two lines:
+    1. A JSON header: {"mtime_ns": ..., "size": ...}
+    2. The parsed YAML document serialized as JSON
+
+Documents that do not survive a JSON round trip unchanged (dates, non-string
+keys, etc.) are never cached. Cache read/write failures are silently ignored
+and fall back to parsing the YAML file directly. PyYAML itself is only
+imported on a cache miss.
+
+Setting the OPENCUFF_NO_CACHE environment variable to any non-empty value
+disables this cache and the discovery cache entirely: nothing is read from or
+written to the cache directory.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def _cache_enabled() -> bool:
+    """Return whether the on-disk caches may be used.
+
+    Returns:
+        False if OPENCUFF_NO_CACHE is set to a non-empty value, True otherwise.
+    """
+    return not os.environ.get("OPENCUFF_NO_CACHE")
+
+
+def _cache_dir() -> Path:
+    """Return the directory used for parse cache files.
+
+    Honors XDG_CACHE_HOME, falling back to ~/.cache.
+
+    Returns:
+        Path to the opencuff cache directory.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "opencuff"
+
+
+def _cache_path_for(path: Path) -> Path:
+    """Return the cache file path for a settings file.
+
+    Args:
+        path: Path to the YAML file.
+
+    Returns:
+        Path to the JSON sidecar cache file.
+    """
+    key = hashlib.sha256(str(path.resolve()).encode()).hexdigest()
+    return _cache_dir() / f"{key}.json"
+
+
+def _parse_yaml(path: Path) -> dict[str, Any]:
+    """Parse a YAML file without consulting the cache.
+
+    Args:
+        path: Path to the YAML file.
+
+    Returns:
+        The parsed document. An empty file yields an empty dict.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        yaml.YAMLError: If the file contains invalid YAML.
+    """
+    # Only pay for importing PyYAML on a cache miss
+    import yaml
+
+    # Prefer the LibYAML C parser when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(path.read_text(), Loader=loader)
+    if data is None:
+        data = {}
+    return data
+
+
+def load_yaml_cached(path: Path) -> dict[str, Any]:
+    """Load a YAML file, using a JSON sidecar cache when it is still valid.
+
+    Args:
+        path: Path to the YAML file.
+
+    Returns:
+        The parsed document. An empty file yields an empty dict.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        yaml.YAMLError: If the file contains invalid YAML.
+    """
+    if not _cache_enabled():
+        return _parse_yaml(path)
+
+    st = path.stat()
+    header = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+    cache_path = _cache_path_for(path)
+
+    try:
+        cached_header, _, cached_body = cache_path.read_text().partition("\n")
+        if json.loads(cached_header) == header:
+            return json.loads(cached_body)
+    except (OSError, ValueError):
+        pass
+
+    data = _parse_yaml(path)
+
+    try:
+        body = json.dumps(data)
+        if json.loads(body) == data:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(f"{json.dumps(header)}\n{body}")
+    except (OSError, TypeError, ValueError):
+        pass
+
+    return data
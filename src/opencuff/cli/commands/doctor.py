@@ -9,12 +9,14 @@ Checks performed:
     3. Plugin modules can be imported
 """
 
+import functools
+import importlib.util
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Annotated
 
 import typer
-import yaml
 
 
 @dataclass
@@ -54,23 +56,21 @@ def doctor_command(
     checks: list[CheckResult] = []
     settings_data: dict | None = None
 
-    # Check 1: Settings file exists
-    file_exists_check = _check_settings_file_exists(config)
-    checks.append(file_exists_check)
+    # Checks 1-2: Settings file exists and is valid YAML
+    settings_checks, settings_data = _load_and_check_settings(config)
+    checks.extend(settings_checks)
 
-    if file_exists_check.passed:
-        # Check 2: Valid YAML
-        yaml_check, settings_data = _check_yaml_validity(config)
-        checks.append(yaml_check)
+    if settings_data is not None:
+        base_dir = config.parent
+        enabled_plugins = _enabled_plugins(settings_data)
 
-        if yaml_check.passed and settings_data is not None:
-            # Check 3: Referenced files exist
-            file_checks = _check_referenced_files(config, settings_data)
-            checks.extend(file_checks)
+        # Check 3: Referenced files exist
+        file_checks = _check_referenced_files(base_dir, enabled_plugins)
+        checks.extend(file_checks)
 
-            # Check 4: Plugin modules can be imported
-            module_checks = _check_plugin_modules(settings_data)
-            checks.extend(module_checks)
+        # Check 4: Plugin modules can be imported
+        module_checks = _check_plugin_modules(enabled_plugins)
+        checks.extend(module_checks)
 
     # Display results
     _display_results(checks)
@@ -81,92 +81,110 @@ def doctor_command(
         raise typer.Exit(1)
 
 
-def _check_settings_file_exists(config: Path) -> CheckResult:
-    """Check if the settings file exists.
+def _load_and_check_settings(
+    config: Path,
+) -> tuple[list[CheckResult], dict | None]:
+    """Check that the settings file exists and contains valid YAML.
+
+    Reads the file once and treats FileNotFoundError as a missing settings
+    file, rather than stat-ing it separately before reading.
 
     Args:
         config: Path to the settings file.
 
     Returns:
-        CheckResult indicating pass/fail.
+        Tuple of (CheckResults, parsed data or None).
     """
-    if config.exists():
-        return CheckResult(
+    # Lazy import so other commands don't pay for settings parsing
+    from opencuff.cli._yaml_cache import load_yaml_cached
+
+    try:
+        data = load_yaml_cached(config)
+    except FileNotFoundError:
+        missing_check = CheckResult(
             name="Settings file",
+            passed=False,
+            message=f"Not found: {config}",
+            suggestion="Run 'cuff init' to create a configuration file.",
+        )
+        return [missing_check], None
+    except Exception as e:
+        # A parse error means PyYAML is already loaded, so this import is free
+        import yaml
+
+        if not isinstance(e, yaml.YAMLError):
+            raise
+        data = None
+        yaml_check = CheckResult(
+            name="YAML syntax",
+            passed=False,
+            message=f"Invalid YAML: {e}",
+            suggestion="Check the YAML syntax and fix any formatting errors.",
+        )
+    else:
+        yaml_check = CheckResult(
+            name="YAML syntax",
             passed=True,
-            message=f"Found: {config}",
+            message="Valid YAML",
         )
-    return CheckResult(
+
+    found_check = CheckResult(
         name="Settings file",
-        passed=False,
-        message=f"Not found: {config}",
-        suggestion="Run 'cuff init' to create a configuration file.",
+        passed=True,
+        message=f"Found: {config}",
     )
+    return [found_check, yaml_check], data
 
 
-def _check_yaml_validity(config: Path) -> tuple[CheckResult, dict | None]:
-    """Check if the settings file contains valid YAML.
+def _enabled_plugins(settings_data: dict) -> list[tuple[str, dict, dict]]:
+    """Collect the enabled plugin entries from raw settings data.
+
+    Entries that are not mappings or are disabled are skipped, so the
+    individual checks don't repeat that filtering.
 
     Args:
-        config: Path to the settings file.
+        settings_data: Parsed settings dictionary.
 
     Returns:
-        Tuple of (CheckResult, parsed data or None).
+        List of (name, plugin config, plugin "config" section) tuples.
     """
-    try:
-        content = config.read_text()
-        data = yaml.safe_load(content)
-        if data is None:
-            data = {}
-        return (
-            CheckResult(
-                name="YAML syntax",
-                passed=True,
-                message="Valid YAML",
-            ),
-            data,
-        )
-    except yaml.YAMLError as e:
-        return (
-            CheckResult(
-                name="YAML syntax",
-                passed=False,
-                message=f"Invalid YAML: {e}",
-                suggestion="Check the YAML syntax and fix any formatting errors.",
-            ),
-            None,
-        )
+    return [
+        (name, plugin_config, plugin_config.get("config") or {})
+        for name, plugin_config in settings_data.get("plugins", {}).items()
+        if isinstance(plugin_config, dict) and plugin_config.get("enabled", True)
+    ]
 
 
-def _check_referenced_files(config: Path, settings_data: dict) -> list[CheckResult]:
+def _check_referenced_files(
+    base_dir: Path, enabled_plugins: list[tuple[str, dict, dict]]
+) -> list[CheckResult]:
     """Check if files referenced in plugin configs exist.
 
     Args:
-        config: Path to the settings file (for resolving relative paths).
-        settings_data: Parsed settings dictionary.
+        base_dir: Directory containing the settings file (for resolving
+            relative paths).
+        enabled_plugins: Enabled plugin entries from _enabled_plugins().
 
     Returns:
         List of CheckResults for each referenced file.
     """
     results: list[CheckResult] = []
-    base_dir = config.parent
-
-    plugins = settings_data.get("plugins", {})
+    base_str = os.fspath(base_dir)
 
-    for name, plugin_config in plugins.items():
-        if not isinstance(plugin_config, dict):
-            continue
-
-        if not plugin_config.get("enabled", True):
-            continue
-
-        config_section = plugin_config.get("config", {})
+    # One directory listing serves every plain filename lookup below.
+    # Symlinks are left out: a link entry doesn't prove its target exists.
+    try:
+        present: set[str] | None = {
+            entry.name for entry in os.scandir(base_str) if not entry.is_symlink()
+        }
+    except OSError:
+        present = None
 
+    for name, _plugin_config, config_section in enabled_plugins:
         # Check for Makefile reference
         if name == "makefile" or "makefile_path" in config_section:
             makefile_path = config_section.get("makefile_path", "./Makefile")
-            full_path = base_dir / makefile_path
-            if full_path.exists():
+            if _referenced_file_exists(base_str, makefile_path, present):
                 results.append(
                     CheckResult(
                         name=f"{name} plugin",
@@ -191,8 +209,7 @@ def _check_referenced_files(config: Path, settings_data: dict) -> list[CheckResu
         if name == "packagejson" or "package_json_path" in config_section:
             pkg_json = config_section.get("package_json_path", "./package.json")
             package_json_path = pkg_json
-            full_path = base_dir / package_json_path
-            if full_path.exists():
+            if _referenced_file_exists(base_str, package_json_path, present):
                 results.append(
                     CheckResult(
                         name=f"{name} plugin",
@@ -216,31 +233,55 @@ def _check_referenced_files(config: Path, settings_data: dict) -> list[CheckResu
     return results
 
 
-def _check_plugin_modules(settings_data: dict) -> list[CheckResult]:
+def _referenced_file_exists(
+    base_dir: str, relative_path: str, present: set[str] | None
+) -> bool:
+    """Check whether a referenced file exists relative to base_dir.
+
+    Paths that name a file directly inside base_dir are looked up in the
+    pre-scanned directory listing first. Only hits are trusted: a miss may be
+    a case-insensitive filesystem matching a differently cased name, so it
+    falls back to a stat call like every other path.
+
+    Args:
+        base_dir: Directory the path is relative to.
+        relative_path: Path as written in the plugin config.
+        present: Names of non-symlink entries in base_dir, or None if it
+            couldn't be listed.
+
+    Returns:
+        True if the file exists.
+    """
+    normalized = os.path.normpath(relative_path)
+    is_plain_name = not os.path.dirname(normalized) and normalized not in (
+        os.curdir,
+        os.pardir,
+    )
+    if present is not None and is_plain_name and normalized in present:
+        return True
+    return os.path.exists(os.path.join(base_dir, relative_path))
+
+
+def _check_plugin_modules(
+    enabled_plugins: list[tuple[str, dict, dict]],
+) -> list[CheckResult]:
     """Check if plugin modules can be imported.
 
     Args:
-        settings_data: Parsed settings dictionary.
+        enabled_plugins: Enabled plugin entries from _enabled_plugins().
 
     Returns:
         List of CheckResults for each module import check.
     """
     results: list[CheckResult] = []
-    plugins = settings_data.get("plugins", {})
-
-    for name, plugin_config in plugins.items():
-        if not isinstance(plugin_config, dict):
-            continue
-
-        if not plugin_config.get("enabled", True):
-            continue
 
+    for name, plugin_config, _config_section in enabled_plugins:
         module_path = plugin_config.get("module")
         if not module_path:
             continue
 
-        try:
-            __import__(module_path)
+        importable, error = _module_importable(module_path)
+        if importable:
             results.append(
                 CheckResult(
                     name=f"Module {name}",
@@ -248,7 +289,7 @@ def _check_plugin_modules(settings_data: dict) -> list[CheckResult]:
                     message=f"Import successful: {module_path}",
                 )
             )
-        except ImportError as e:
+        else:
             suggestion = (
                 "Check that the module path is correct and the module is installed."
             )
@@ -256,7 +297,7 @@ def _check_plugin_modules(settings_data: dict) -> list[CheckResult]:
                 CheckResult(
                     name=f"Module {name}",
                     passed=False,
-                    message=f"Import failed: {module_path} ({e})",
+                    message=f"Import failed: {module_path} ({error})",
                     suggestion=suggestion,
                 )
             )
@@ -264,6 +305,28 @@ def _check_plugin_modules(settings_data: dict) -> list[CheckResult]:
     return results
 
 
+@functools.cache
+def _module_importable(module_path: str) -> tuple[bool, str]:
+    """Check whether a module can be imported without executing it.
+
+    Uses importlib.util.find_spec, which resolves the module spec but does not
+    run the module's top-level code. Parent packages are still imported.
+
+    Args:
+        module_path: Dotted module path to check.
+
+    Returns:
+        Tuple of (importable, error message or empty string).
+    """
+    try:
+        spec = importlib.util.find_spec(module_path)
+    except (ImportError, ValueError) as e:
+        return False, str(e)
+    if spec is None:
+        return False, f"No module named {module_path!r}"
+    return True, ""
+
+
 def _display_results(checks: list[CheckResult]) -> None:
     """Display check results in a human-readable format.
 
@@ -272,6 +335,7 @@ def _display_results(checks: list[CheckResult]) -> None:
     """
     passed_count = 0
     failed_count = 0
+    lines: list[str] = []
 
     for check in checks:
         if check.passed:
@@ -281,10 +345,13 @@ def _display_results(checks: list[CheckResult]) -> None:
             failed_count += 1
             prefix = "[FAIL]"
 
-        typer.echo(f"{prefix} {check.name}: {check.message}")
+        lines.append(f"{prefix} {check.name}: {check.message}")
 
         if check.suggestion:
-            typer.echo(f"       Suggestion: {check.suggestion}")
+            lines.append(f"       Suggestion: {check.suggestion}")
+
+    lines.append("")
+    lines.append(f"Summary: {passed_count} passed, {failed_count} errors")
 
-    typer.echo()
-    typer.echo(f"Summary: {passed_count} passed, {failed_count} errors")
+    # Emit the report with a single write
+    typer.echo("\n".join(lines))
@@ -14,13 +14,6 @@ from pathlib import Path
 from typing import Annotated
 
 import typer
-import yaml
-
-from opencuff.cli.discovery import DiscoveryCoordinator
-from opencuff.plugins.discovery_registry import (
-    get_discoverable_plugins,
-    get_module_paths,
-)
 
 
 def init_command(
@@ -61,12 +54,29 @@ def init_command(
             help="Comma-separated list of plugins to exclude",
         ),
     ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Ignore cached discovery results and rescan the directory",
+        ),
+    ] = False,
 ) -> None:
     """Initialize a new settings.yml based on discovered plugins.
 
     Scans the current directory for applicable plugins (Makefile, package.json, etc.)
     and generates a configuration file.
     """
+    # Lazy imports so other commands don't pay for discovery and YAML
+    import yaml
+
+    from opencuff.cli._discovery_cache import load_or_discover
+    from opencuff.cli.discovery import DiscoveryCoordinator
+    from opencuff.plugins.discovery_registry import (
+        get_discoverable_plugins,
+        get_module_paths,
+    )
+
     # Check if output file exists
     if output.exists() and not force and not dry_run:
         msg = f"Error: {output} already exists. Use --force to overwrite."
@@ -88,7 +98,7 @@ def init_command(
 
     # Discover plugins
     typer.echo("Discovering plugins...")
-    results = coordinator.discover_all(scan_dir)
+    results = load_or_discover(coordinator, scan_dir, use_cache=not no_cache)
 
     # Show discovery results
     applicable_count = 0
@@ -96,12 +106,12 @@ def init_command(
         if result.applicable:
             applicable_count += 1
             prefix = "[+]"
-            items_info = ""
-            if result.discovered_items:
-                items_preview = ", ".join(result.discovered_items[:3])
-                if len(result.discovered_items) > 3:
-                    items_preview += ", ..."
-                items_info = f" ({items_preview})"
+            items = result.discovered_items
+            if items:
+                suffix = ", ..." if len(items) > 3 else ""
+                items_info = f" ({', '.join(items[:3])}{suffix})"
+            else:
+                items_info = ""
             typer.echo(f"  {prefix} {name}: {result.description}{items_info}")
         else:
             prefix = "[-]"
@@ -121,6 +131,7 @@ def init_command(
         scan_dir,
         include=include_list,
         exclude=exclude_list,
+        results=results,
     )
 
     # Check if we have any plugins after filtering
@@ -129,19 +140,25 @@ def init_command(
         typer.echo(msg, err=True)
         raise typer.Exit(1)
 
-    # Generate YAML content
-    yaml_content = yaml.dump(settings, default_flow_style=False, sort_keys=False)
+    dump_options = {
+        # Prefer the LibYAML C emitter when PyYAML was built with it
+        "Dumper": getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        "default_flow_style": False,
+        "sort_keys": False,
+    }
 
     if dry_run:
+        yaml_content = yaml.dump(settings, **dump_options)
         typer.echo("\n--- Generated settings.yml (dry run) ---")
         typer.echo(yaml_content)
         typer.echo("--- End ---")
         typer.echo(f"\nWould write to: {output}")
         return
 
-    # Write the file
+    # Write the file, streaming the YAML straight to the handle
     try:
-        output.write_text(yaml_content)
+        with output.open("w", encoding="utf-8") as f:
+            yaml.dump(settings, f, **dump_options)
     except OSError as e:
         typer.echo(f"Error: Failed to write {output}: {e}", err=True)
         raise typer.Exit(3) from e
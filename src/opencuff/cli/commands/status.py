@@ -6,12 +6,12 @@ of all configured plugins.
 
 import json
 from pathlib import Path
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
-import yaml
 
-from opencuff.plugins.config import PluginConfig, PluginType, load_settings
+if TYPE_CHECKING:
+    from opencuff.plugins.base import DiscoveryResult
 
 
 def status_command(
@@ -44,15 +44,19 @@ def status_command(
     Loads the settings.yml file and displays information about each
     configured plugin including its state and available tools.
     """
-    # Check if config file exists
-    if not config.exists():
-        typer.echo(f"Error: Settings file not found: {config}", err=True)
-        typer.echo("\nRun 'cuff init' to create a configuration file.", err=True)
-        raise typer.Exit(1)
+    # Lazy imports so other commands don't pay for YAML and Pydantic
+    import yaml
+
+    from opencuff.cli._yaml_cache import load_yaml_cached
+    from opencuff.plugins.config import settings_from_dict
 
     # Load settings
     try:
-        settings = load_settings(config)
+        settings = settings_from_dict(load_yaml_cached(config))
+    except FileNotFoundError as e:
+        typer.echo(f"Error: Settings file not found: {config}", err=True)
+        typer.echo("\nRun 'cuff init' to create a configuration file.", err=True)
+        raise typer.Exit(1) from e
     except yaml.YAMLError as e:
         typer.echo(f"Error: Invalid YAML in {config}: {e}", err=True)
         raise typer.Exit(2) from e
@@ -84,6 +88,11 @@ def _build_status_data(
     Returns:
         Dictionary containing status information.
     """
+    from opencuff.plugins.config import PluginType
+
+    # Run discovery for every enabled plugin in a single pass up front
+    discovery_results = _discover_enabled_plugins(settings, config_path.parent)
+
     enabled_count = 0
     disabled_count = 0
     plugins_status: list[dict] = []
@@ -105,8 +114,9 @@ def _build_status_data(
         if plugin_config.type == PluginType.IN_SOURCE and plugin_config.module:
             plugin_info["module"] = plugin_config.module
 
-        # Get tools using plugin discovery mechanism
-        tools = _get_plugin_tools_via_discovery(name, plugin_config, config_path.parent)
+        # Get tools from the plugin's discovery result
+        result = discovery_results.get(name)
+        tools = list(result.discovered_items) if result and result.applicable else []
         plugin_info["tools"] = tools
         plugin_info["tool_count"] = len(tools)
 
@@ -123,45 +133,36 @@ def _build_status_data(
     }
 
 
-def _get_plugin_tools_via_discovery(
-    name: str, plugin_config: PluginConfig, base_dir: Path
-) -> list[str]:
-    """Get the list of tools a plugin would expose using discovery mechanism.
+def _discover_enabled_plugins(
+    settings: Any, base_dir: Path
+) -> dict[str, "DiscoveryResult"]:
+    """Run discovery once for all enabled, discoverable plugins.
 
-    Uses the plugin's discover() method to get the discovered items,
-    which represent the tools the plugin would expose.
+    The discovered items of each result represent the tools the plugin
+    would expose.
 
     Args:
-        name: Plugin name.
-        plugin_config: Plugin configuration.
+        settings: The loaded OpenCuffSettings object.
         base_dir: Base directory for resolving relative paths.
 
     Returns:
-        List of tool names the plugin would expose.
+        Mapping of plugin names to their DiscoveryResult objects. Plugins that
+        are disabled or not discoverable are absent.
     """
-    if not plugin_config.enabled:
-        return []
-
     try:
-        # Lazy import to avoid circular dependencies
+        from opencuff.cli.discovery import DiscoveryCoordinator
         from opencuff.plugins.discovery_registry import get_discoverable_plugins
 
-        plugins = get_discoverable_plugins()
-        plugin_cls = plugins.get(name)
-
-        if plugin_cls is None:
-            return []
-
-        # Use the plugin's discover method
-        result = plugin_cls.discover(base_dir)
-
-        if not result.applicable:
-            return []
-
-        return result.discovered_items
-
+        discoverable = get_discoverable_plugins()
+        plugins = {
+            name: discoverable[name]
+            for name, plugin_config in settings.plugins.items()
+            if plugin_config.enabled and name in discoverable
+        }
+        coordinator = DiscoveryCoordinator(plugins=plugins, module_paths={})
+        return coordinator.discover_all(base_dir)
     except Exception:
-        return []
+        return {}
 
 
 def _display_status(status_data: dict, verbose: bool) -> None:
@@ -171,38 +172,40 @@ def _display_status(status_data: dict, verbose: bool) -> None:
         status_data: Status data dictionary.
         verbose: Whether to show detailed information.
     """
-    typer.echo("OpenCuff Status")
-    typer.echo("=" * 15)
-    typer.echo()
-
-    typer.echo(f"Settings: {status_data['settings_path']}")
-    typer.echo(
+    lines = [
+        "OpenCuff Status",
+        "=" * 15,
+        "",
+        f"Settings: {status_data['settings_path']}",
         f"Plugins: {status_data['enabled_count']} enabled, "
-        f"{status_data['disabled_count']} disabled"
-    )
-    typer.echo()
+        f"{status_data['disabled_count']} disabled",
+        "",
+    ]
 
     for plugin in status_data["plugins"]:
         state_str = "active" if plugin["enabled"] else "disabled"
-        typer.echo(f"{plugin['name']} ({state_str})")
+        lines.append(f"{plugin['name']} ({state_str})")
 
         if plugin["enabled"]:
-            typer.echo(f"  Type: {plugin['type']}")
+            lines.append(f"  Type: {plugin['type']}")
 
             if "module" in plugin:
-                typer.echo(f"  Module: {plugin['module']}")
+                lines.append(f"  Module: {plugin['module']}")
 
             tools = plugin.get("tools", [])
             if tools:
-                typer.echo(f"  Tools: {len(tools)}")
-                for tool in tools:
-                    typer.echo(f"    - {tool}")
+                lines.append(f"  Tools: {len(tools)}")
+                lines.extend(f"    - {tool}" for tool in tools)
             else:
-                typer.echo("  Tools: none")
+                lines.append("  Tools: none")
 
         if verbose and "config" in plugin:
-            typer.echo("  Config:")
-            for key, value in plugin["config"].items():
-                typer.echo(f"    {key}: {value}")
+            lines.append("  Config:")
+            lines.extend(
+                f"    {key}: {value}" for key, value in plugin["config"].items()
+            )
+
+        lines.append("")
 
-        typer.echo()
+    # Emit the report with a single write
+    typer.echo("\n".join(lines))
@@ -3,6 +3,7 @@
 This module provides the `cuff version` command that displays version information.
 """
 
+import functools
 import sys
 from typing import Annotated
 
@@ -10,17 +11,32 @@ import typer
 
 
 def get_version() -> str:
-    """Get the installed OpenCuff version.
+    """Get the OpenCuff version.
 
     Returns:
-        Version string or 'unknown' if not found.
+        Version string from opencuff._version.
     """
-    try:
-        from importlib.metadata import version
+    from opencuff._version import __version__
+
+    return __version__
+
+
+@functools.cache
+def _dependency_version(name: str) -> str | None:
+    """Look up the installed version of a dependency.
+
+    Args:
+        name: Distribution name.
 
-        return version("opencuff")
-    except Exception:
-        return "unknown"
+    Returns:
+        Version string, or None if the distribution is not installed.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
 
 
 def version_command(
@@ -53,10 +69,5 @@ def version_command(
     typer.echo("\nDependencies:")
     dependencies = ["fastmcp", "pydantic", "typer", "pyyaml"]
     for dep in dependencies:
-        try:
-            from importlib.metadata import version
-
-            dep_version = version(dep)
-            typer.echo(f"  {dep}: {dep_version}")
-        except Exception:
-            typer.echo(f"  {dep}: not found")
+        dep_version = _dependency_version(dep)
+        typer.echo(f"  {dep}: {dep_version or 'not found'}")
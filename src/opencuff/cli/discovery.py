@@ -7,10 +7,12 @@ Classes:
     DiscoveryCoordinator: Coordinates plugin discovery and settings generation.
 """
 
+import functools
+import inspect
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from opencuff.plugins.base import DiscoveryResult
+from opencuff.plugins.base import DiscoveryContext, DiscoveryResult
 
 if TYPE_CHECKING:
     from opencuff.plugins.base import InSourcePlugin
@@ -37,6 +39,15 @@ class DiscoveryCoordinator:
         >>> settings = coordinator.generate_settings(Path("."))
     """
 
+    __slots__ = ("_default_modules", "_module_paths", "_plugins")
+
+    # Default plugin_settings section of generated settings (copied per call)
+    _DEFAULT_PLUGIN_SETTINGS: dict[str, Any] = {
+        "health_check_interval": 30,
+        "live_reload": True,
+        "default_timeout": 30,
+    }
+
     def __init__(
         self,
         plugins: dict[str, type["InSourcePlugin"]],
@@ -50,12 +61,24 @@ class DiscoveryCoordinator:
         """
         self._plugins = plugins
         self._module_paths = module_paths
+        # Module paths are fixed at construction, so resolve defaults once
+        self._default_modules = {
+            name: module_paths.get(name, f"opencuff.plugins.builtin.{name}")
+            for name in plugins
+        }
+
+    @property
+    def plugins(self) -> dict[str, type["InSourcePlugin"]]:
+        """Return the mapping of plugin names to plugin classes."""
+        return self._plugins
 
     def discover_all(self, directory: Path) -> dict[str, DiscoveryResult]:
         """Run discovery for all registered plugins.
 
         Scans the given directory using each plugin's discover() method
-        and returns all results (both applicable and non-applicable).
+        and returns all results (both applicable and non-applicable). The
+        directory is listed once and the resulting DiscoveryContext is passed
+        to every plugin whose discover() accepts it.
 
         Args:
             directory: The directory to scan for plugin applicability.
@@ -72,11 +95,20 @@ class DiscoveryCoordinator:
         if not directory.is_dir():
             raise ValueError(f"Path is not a directory: {directory}")
 
+        # List the directory once and share the snapshot between plugins
+        try:
+            context: DiscoveryContext | None = DiscoveryContext.scan(directory)
+        except OSError:
+            context = None
+
         results: dict[str, DiscoveryResult] = {}
 
         for name, plugin_cls in self._plugins.items():
             try:
-                result = plugin_cls.discover(directory)
+                if context is not None and _accepts_context(plugin_cls):
+                    result = plugin_cls.discover(directory, context=context)
+                else:
+                    result = plugin_cls.discover(directory)
                 results[name] = result
             except Exception:
                 # If discovery fails, treat as not applicable
@@ -94,6 +126,7 @@ class DiscoveryCoordinator:
         directory: Path,
         include: list[str] | None = None,
         exclude: list[str] | None = None,
+        results: dict[str, DiscoveryResult] | None = None,
     ) -> dict[str, Any]:
         """Generate settings.yml content from discovery results.
 
@@ -104,47 +137,56 @@ class DiscoveryCoordinator:
             directory: The directory to scan.
             include: Optional list of plugin names to include (others excluded).
             exclude: Optional list of plugin names to exclude.
+            results: Optional results of a previous discover_all() call on this
+                coordinator for the same directory. Discovery is only run when
+                this is None.
 
         Returns:
             Dictionary representing the settings.yml content.
         """
-        results = self.discover_all(directory)
-
-        # Filter by include/exclude
-        filtered_plugins: dict[str, DiscoveryResult] = {}
-        for name, result in results.items():
-            # Skip non-applicable plugins
-            if not result.applicable:
-                continue
-
-            # Apply include filter
-            if include is not None and name not in include:
-                continue
-
-            # Apply exclude filter
-            if exclude is not None and name in exclude:
-                continue
-
-            filtered_plugins[name] = result
-
-        # Build settings structure
-        plugins_config: dict[str, dict[str, Any]] = {}
-        for name, result in filtered_plugins.items():
-            default_module = f"opencuff.plugins.builtin.{name}"
-            module_path = self._module_paths.get(name, default_module)
-            plugins_config[name] = {
+        if results is None:
+            results = self.discover_all(directory)
+
+        # Convert filters to sets once so each membership test is O(1)
+        include_set = frozenset(include) if include is not None else None
+        exclude_set = frozenset(exclude) if exclude is not None else frozenset()
+
+        # Filter applicable plugins and build the settings structure in one pass
+        plugins_config: dict[str, dict[str, Any]] = {
+            name: {
                 "enabled": True,
                 "type": "in_source",
-                "module": module_path,
+                "module": self._default_modules[name],
                 "config": result.suggested_config,
             }
+            for name, result in results.items()
+            if result.applicable
+            and (include_set is None or name in include_set)
+            and name not in exclude_set
+        }
 
         return {
             "version": "1",
-            "plugin_settings": {
-                "health_check_interval": 30,
-                "live_reload": True,
-                "default_timeout": 30,
-            },
+            "plugin_settings": dict(self._DEFAULT_PLUGIN_SETTINGS),
             "plugins": plugins_config,
         }
+
+
+@functools.cache
+def _accepts_context(plugin_cls: type["InSourcePlugin"]) -> bool:
+    """Check whether a plugin's discover() accepts a context argument.
+
+    Plugins written before DiscoveryContext existed override discover() with
+    only a directory parameter and are called without it.
+
+    Args:
+        plugin_cls: The plugin class to inspect.
+
+    Returns:
+        True if discover() has a context parameter.
+    """
+    try:
+        parameters = inspect.signature(plugin_cls.discover).parameters
+    except (TypeError, ValueError):
+        return False
+    return "context" in parameters
@@ -1,8 +1,9 @@
 """OpenCuff CLI entry point.
 
 This module provides the main Typer application and entry point for the `cuff` CLI.
-It registers core commands (init, status, doctor, run, version) and dynamically
-registers plugin commands with appropriate error handling.
+It registers core commands (init, status, doctor, run, version) and lazily
+registers plugin commands with appropriate error handling: plugin modules are
+only imported when a plugin command is invoked or the command list is shown.
 
 Usage:
     cuff init [options]       - Initialize settings.yml
@@ -14,17 +15,94 @@ Usage:
 """
 
 import logging
+from typing import TYPE_CHECKING, Any
 
+import click
 import typer
+from typer.core import TyperGroup
 
 from opencuff.cli.commands import doctor, init, run, status, version
 
+if TYPE_CHECKING:
+    from opencuff.plugins.base import InSourcePlugin
+
 logger = logging.getLogger(__name__)
 
+
+class LazyPluginGroup(TyperGroup):
+    """Typer group that resolves plugin sub-commands on first use.
+
+    Core commands are registered eagerly. Listing commands (e.g. for --help)
+    only needs the names of plugins that override get_cli_commands(), and a
+    plugin's sub-app is built when its name is looked up. Running a core
+    command never touches the plugin registry.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the group with empty plugin caches."""
+        super().__init__(*args, **kwargs)
+        self._plugin_classes: dict[str, type[InSourcePlugin]] | None = None
+        self._plugin_commands: dict[str, click.Command | None] = {}
+
+    def _get_plugin_classes(self) -> dict[str, type["InSourcePlugin"]]:
+        """Return the plugins that declare CLI commands.
+
+        A plugin declares commands by overriding get_cli_commands(); the
+        method itself is not called here.
+
+        Returns:
+            Mapping of plugin names to plugin classes.
+        """
+        if self._plugin_classes is None:
+            try:
+                # Lazy import to avoid circular dependencies and speed up startup
+                from opencuff.plugins.base import InSourcePlugin
+                from opencuff.plugins.discovery_registry import (
+                    get_discoverable_plugins,
+                )
+
+                # Checked via the class dicts so overrides of any kind count,
+                # whether classmethod, staticmethod or plain function
+                self._plugin_classes = {
+                    name: plugin_cls
+                    for name, plugin_cls in get_discoverable_plugins().items()
+                    if any(
+                        "get_cli_commands" in vars(klass)
+                        for klass in plugin_cls.__mro__
+                        if klass is not InSourcePlugin
+                    )
+                }
+            except Exception as e:
+                logger.warning("Failed to load plugin registry for CLI commands: %s", e)
+                self._plugin_classes = {}
+        return self._plugin_classes
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return core command names followed by plugin command names."""
+        core = super().list_commands(ctx)
+        plugins = [name for name in self._get_plugin_classes() if name not in core]
+        return [*core, *plugins]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return a core command, falling back to plugin commands."""
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+
+        if cmd_name not in self._plugin_commands:
+            plugin_cls = self._get_plugin_classes().get(cmd_name)
+            plugin_app = _build_plugin_app(cmd_name, plugin_cls) if plugin_cls else None
+            self._plugin_commands[cmd_name] = (
+                typer.main.get_group(plugin_app) if plugin_app else None
+            )
+        return self._plugin_commands[cmd_name]
+
+
 app = typer.Typer(
     name="cuff",
     help="OpenCuff CLI - Controlled operations for coding agents",
     no_args_is_help=True,
+    cls=LazyPluginGroup,
 )
 
 # Register core commands
@@ -35,61 +113,43 @@ app.command(name="run")(run.run_command)
 app.command(name="version")(version.version_command)
 
 
-def register_plugin_commands(app: typer.Typer) -> None:
-    """Dynamically register plugin CLI commands.
-
-    Discovers all plugins that provide CLI commands via get_cli_commands()
-    and registers them as subcommands under the plugin name.
+def _build_plugin_app(
+    name: str, plugin_cls: type["InSourcePlugin"]
+) -> typer.Typer | None:
+    """Build the Typer sub-app for a plugin's CLI commands.
 
     Args:
-        app: The main Typer application to register commands on.
+        name: The plugin name.
+        plugin_cls: The plugin class.
 
-    Note:
-        This function logs warnings but does not raise exceptions to ensure
-        core commands remain functional even if plugin registration fails.
+    Returns:
+        The plugin sub-app, or None if the plugin has no commands or they
+        could not be registered (a warning is logged).
     """
     try:
-        # Lazy import to avoid circular dependencies and speed up CLI startup
-        from opencuff.plugins.discovery_registry import get_discoverable_plugins
+        cli_commands = plugin_cls.get_cli_commands()
+        if not cli_commands:
+            return None
 
-        plugins = get_discoverable_plugins()
-
-        for name, plugin_cls in plugins.items():
-            try:
-                cli_commands = plugin_cls.get_cli_commands()
-                if not cli_commands:
-                    continue
-
-                # Create a sub-app for this plugin
-                plugin_app = typer.Typer(
-                    name=name,
-                    help=f"{name} plugin commands",
-                )
+        # Create a sub-app for this plugin
+        plugin_app = typer.Typer(
+            name=name,
+            help=f"{name} plugin commands",
+        )
 
-                for cmd in cli_commands:
-                    # Register each command on the plugin sub-app
-                    plugin_app.command(name=cmd.name, help=cmd.help)(cmd.callback)
+        for cmd in cli_commands:
+            # Register each command on the plugin sub-app
+            plugin_app.command(name=cmd.name, help=cmd.help)(cmd.callback)
 
-                # Add the plugin sub-app to the main app
-                app.add_typer(plugin_app, name=name)
-
-            except Exception as e:
-                logger.warning(
-                    "Failed to register CLI commands for plugin %s: %s",
-                    name,
-                    e,
-                )
+        return plugin_app
 
     except Exception as e:
-        logger.warning("Failed to load plugin registry for CLI commands: %s", e)
-
-
-# Dynamically register plugin commands with error handling
-try:
-    register_plugin_commands(app)
-except Exception as e:
-    # Log but don't crash - core commands should still work
-    logger.warning("Failed to register some plugin commands: %s", e)
+        logger.warning(
+            "Failed to register CLI commands for plugin %s: %s",
+            name,
+            e,
+        )
+        return None
 
 
 def main() -> None:
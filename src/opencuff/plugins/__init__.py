@@ -18,6 +18,7 @@ from opencuff.plugins.base import (
     PluginState,
     ToolDefinition,
     ToolResult,
+    freeze_schemas,
 )
 
 # Lazy imports to avoid circular dependencies during development
@@ -28,6 +29,7 @@ __all__ = [
     "PluginState",
     "ToolDefinition",
     "ToolResult",
+    "freeze_schemas",
 ]
 
 
@@ -10,6 +10,8 @@ Classes:
 
 import importlib
 import importlib.util
+import os
+import sys
 from typing import Any
 
 import structlog
@@ -24,6 +26,37 @@ from opencuff.plugins.errors import PluginError, PluginErrorCode
 
 logger = structlog.get_logger()
 
+# Validated plugin classes keyed by (module path, class name). Entries are
+# re-checked against the module namespace on every lookup, so a module reload
+# that rebinds the class invalidates them.
+_plugin_class_cache: dict[tuple[str, str], type[InSourcePlugin]] = {}
+
+# Source file stamps keyed by module path, recorded when an adapter actually
+# imports or reloads the module. Kept per module rather than per adapter so
+# that an adapter sharing a module already in sys.modules compares against
+# the code that was loaded, not against the file as it is now.
+_module_stamps: dict[str, tuple[int, int] | None] = {}
+
+
+def _stat_module(module: Any) -> tuple[int, int] | None:
+    """Return the (mtime_ns, size) of a module's source file.
+
+    Args:
+        module: The loaded module.
+
+    Returns:
+        The file stamp, or None if the module has no file or it cannot
+        be stat-ed.
+    """
+    module_file = getattr(module, "__file__", None)
+    if not module_file:
+        return None
+    try:
+        st = os.stat(module_file)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
 class InSourceAdapter(PluginProtocol):
     """Adapter for in-source Python plugins.
@@ -41,7 +74,7 @@ class InSourceAdapter(PluginProtocol):
         _plugin_class_name: The name of the plugin class in the module.
         _config: Plugin-specific configuration.
         _plugin: The instantiated plugin instance.
-        _allowed_prefixes: List of allowed module path prefixes for security.
+        _allowed_prefixes: Tuple of allowed module path prefixes for security.
 
     Example:
         adapter = InSourceAdapter(
@@ -56,7 +89,7 @@ class InSourceAdapter(PluginProtocol):
     """
 
     # Default allowed module path prefixes for security
-    DEFAULT_ALLOWED_PREFIXES: list[str] = ["opencuff.plugins."]
+    DEFAULT_ALLOWED_PREFIXES: tuple[str, ...] = ("opencuff.plugins.",)
 
     def __init__(
         self,
@@ -85,8 +118,9 @@ class InSourceAdapter(PluginProtocol):
         self._config = config or {}
         self._plugin: InSourcePlugin | None = None
         self._module: Any = None
+        # Stored as a tuple so str.startswith can test every prefix in one call
         self._allowed_prefixes = (
-            allowed_prefixes
+            tuple(allowed_prefixes)
             if allowed_prefixes is not None
             else self.DEFAULT_ALLOWED_PREFIXES
         )
@@ -113,7 +147,7 @@ class InSourceAdapter(PluginProtocol):
         Returns:
             True if the module path is allowed, False otherwise.
         """
-        return any(module_path.startswith(prefix) for prefix in self._allowed_prefixes)
+        return module_path.startswith(self._allowed_prefixes)
 
     async def initialize(self, config: dict[str, Any]) -> None:
         """Load the module and initialize the plugin.
@@ -126,30 +160,22 @@ class InSourceAdapter(PluginProtocol):
             PluginError: If the module cannot be loaded or the plugin
                 class cannot be found or instantiated.
         """
-        # Merge configs (init config takes precedence)
-        merged_config = {**config, **self._config}
+        # Merge configs (init config takes precedence). The plugin gets its
+        # own dict either way, so it can't mutate the caller's or ours.
+        merged_config = dict(config) if config else {}
+        merged_config.update(self._config)
 
         try:
-            # Load the module
+            # Load the module (import_module returns sys.modules entries
+            # directly without taking the import lock). Only stamp it if this
+            # call executed it; otherwise the file may be newer than the code.
+            already_loaded = self._module_path in sys.modules
             self._module = importlib.import_module(self._module_path)
+            if not already_loaded:
+                _module_stamps[self._module_path] = _stat_module(self._module)
 
-            # Get the plugin class
-            if not hasattr(self._module, self._plugin_class_name):
-                raise PluginError(
-                    code=PluginErrorCode.LOAD_FAILED,
-                    message=f"Module does not have class '{self._plugin_class_name}'",
-                    plugin_name=self._name,
-                )
-
-            plugin_class = getattr(self._module, self._plugin_class_name)
-
-            # Validate it's a proper plugin class
-            if not issubclass(plugin_class, InSourcePlugin):
-                raise PluginError(
-                    code=PluginErrorCode.LOAD_FAILED,
-                    message=f"Class '{self._plugin_class_name}' is not InSourcePlugin",
-                    plugin_name=self._name,
-                )
+            # Get the validated plugin class
+            plugin_class = self._resolve_plugin_class()
 
             # Instantiate and initialize the plugin
             self._plugin = plugin_class(merged_config)
@@ -178,6 +204,45 @@ class InSourceAdapter(PluginProtocol):
                 cause=e,
             ) from e
 
+    def _resolve_plugin_class(self) -> type[InSourcePlugin]:
+        """Look up and validate the plugin class in the loaded module.
+
+        Validated classes are cached per (module path, class name) so that
+        adapters sharing a module skip the subclass check.
+
+        Returns:
+            The plugin class.
+
+        Raises:
+            PluginError: If the module has no such class or the class is not
+                an InSourcePlugin subclass.
+        """
+        key = (self._module_path, self._plugin_class_name)
+        plugin_class = vars(self._module).get(self._plugin_class_name)
+        if plugin_class is not None and _plugin_class_cache.get(key) is plugin_class:
+            return plugin_class
+
+        # Get the plugin class
+        if not hasattr(self._module, self._plugin_class_name):
+            raise PluginError(
+                code=PluginErrorCode.LOAD_FAILED,
+                message=f"Module does not have class '{self._plugin_class_name}'",
+                plugin_name=self._name,
+            )
+
+        plugin_class = getattr(self._module, self._plugin_class_name)
+
+        # Validate it's a proper plugin class
+        if not issubclass(plugin_class, InSourcePlugin):
+            raise PluginError(
+                code=PluginErrorCode.LOAD_FAILED,
+                message=f"Class '{self._plugin_class_name}' is not InSourcePlugin",
+                plugin_name=self._name,
+            )
+
+        _plugin_class_cache[key] = plugin_class
+        return plugin_class
+
     async def get_tools(self) -> list[ToolDefinition]:
         """Return the tools provided by this plugin.
 
@@ -296,7 +361,10 @@ class InSourceAdapter(PluginProtocol):
         """Reload the Python module (hot reload).
 
         This is useful during development to pick up code changes
-        without restarting the server.
+        without restarting the server. The module is only re-executed if
+        its source file changed since an adapter last imported or reloaded
+        it; a module first imported elsewhere is always re-executed. The
+        plugin is re-instantiated either way.
 
         Note: Module reloading has limitations and may not work
         correctly in all cases. Use with caution.
@@ -312,12 +380,17 @@ class InSourceAdapter(PluginProtocol):
         if self._plugin is not None:
             await self._plugin.shutdown()
 
-        # Reload the module
+        # Reload the module if its source changed
         try:
-            self._module = importlib.reload(self._module)
+            stamp = _stat_module(self._module)
+            if stamp is None or stamp != _module_stamps.get(self._module_path):
+                self._module = importlib.reload(self._module)
+                # Stamped before reloading, so an edit made mid-reload is
+                # picked up by the next check
+                _module_stamps[self._module_path] = stamp
 
             # Re-instantiate the plugin
-            plugin_class = getattr(self._module, self._plugin_class_name)
+            plugin_class = self._resolve_plugin_class()
             self._plugin = plugin_class(self._config)
             await self._plugin.initialize()
 
@@ -35,12 +35,15 @@ class RequestBarrier:
 
     Thread Safety:
         This class is designed for use with asyncio and is safe to use
-        from multiple concurrent coroutines. It uses the following
-        synchronization primitives:
-            - asyncio.Lock: Protects the active request counter
-            - asyncio.Event: Signals when requests have drained
+        from multiple concurrent coroutines. The active request counter
+        is a plain int: it is only updated between await points, so the
+        event loop cannot interleave other coroutines with the update.
+        It uses the following synchronization primitives, created on the
+        first reload so barriers that never reload don't allocate them:
             - asyncio.Event: Signals when reload is complete
             - asyncio.Lock: Serializes concurrent reload operations
+        A reload waiting for in-flight requests to drain awaits a one-shot
+        asyncio.Future that the last finishing request resolves.
 
         Note that this class is NOT thread-safe for use across multiple
         threads. It should only be used within a single asyncio event loop.
@@ -68,16 +71,15 @@ class RequestBarrier:
                 when queued during a reload. Default is 5 seconds.
         """
         self._active_requests: int = 0
-        self._lock = asyncio.Lock()
-        self._drain_event = asyncio.Event()
-        self._ready_event = asyncio.Event()
         self._reloading = False
         self._queue_timeout = queue_timeout
-        self._reload_lock = asyncio.Lock()
 
-        # Initially ready (not reloading)
-        self._ready_event.set()
-        self._drain_event.set()
+        # Created on first reload by _reload_primitives()
+        self._ready_event: asyncio.Event | None = None
+        self._reload_lock: asyncio.Lock | None = None
+
+        # Set only while a reload waits for in-flight requests to drain
+        self._drain_future: asyncio.Future[None] | None = None
 
     @property
     def active_requests(self) -> int:
@@ -106,31 +108,34 @@ class RequestBarrier:
             async with barrier.request_scope():
                 result = await plugin.call_tool(tool_name, arguments)
         """
-        # Wait if a reload is in progress
-        try:
-            await asyncio.wait_for(
-                self._ready_event.wait(),
-                timeout=self._queue_timeout,
-            )
-        except TimeoutError as e:
-            raise PluginError(
-                code=PluginErrorCode.TIMEOUT,
-                message="Plugin reload in progress, request timed out",
-            ) from e
-
-        # Register this request as active
-        async with self._lock:
-            self._active_requests += 1
-            self._drain_event.clear()
+        # Wait if a reload is in progress. The common no-reload case skips
+        # wait_for entirely, avoiding its timer and task allocation.
+        ready_event = self._ready_event
+        if ready_event is not None and not ready_event.is_set():
+            try:
+                await asyncio.wait_for(
+                    ready_event.wait(),
+                    timeout=self._queue_timeout,
+                )
+            except TimeoutError as e:
+                raise PluginError(
+                    code=PluginErrorCode.TIMEOUT,
+                    message="Plugin reload in progress, request timed out",
+                ) from e
+
+        # Register this request as active. No await separates the ready
+        # check from the increment, so a reload cannot start in between.
+        self._active_requests += 1
 
         try:
             yield
         finally:
-            # Unregister this request
-            async with self._lock:
-                self._active_requests -= 1
-                if self._active_requests == 0:
-                    self._drain_event.set()
+            # Unregister this request, waking a reload waiting for the drain
+            self._active_requests -= 1
+            if self._active_requests == 0:
+                drain_future = self._drain_future
+                if drain_future is not None and not drain_future.done():
+                    drain_future.set_result(None)
 
     @asynccontextmanager
     async def reload_scope(self) -> AsyncIterator[None]:
@@ -148,19 +153,40 @@ class RequestBarrier:
                 plugin = await create_new_plugin(new_config)
                 await plugin.initialize()
         """
+        reload_lock, ready_event = self._reload_primitives()
+
         # Serialize reload operations
-        async with self._reload_lock:
+        async with reload_lock:
             # Signal that reload is starting - block new requests
-            self._ready_event.clear()
+            ready_event.clear()
             self._reloading = True
 
             try:
                 # Wait for all in-flight requests to complete
-                await self._drain_event.wait()
+                if self._active_requests > 0:
+                    drain_future = asyncio.get_running_loop().create_future()
+                    self._drain_future = drain_future
+                    try:
+                        await drain_future
+                    finally:
+                        self._drain_future = None
 
                 yield  # Perform the actual reload
 
             finally:
                 # Reload complete - allow new requests
                 self._reloading = False
-                self._ready_event.set()
+                ready_event.set()
+
+    def _reload_primitives(self) -> tuple[asyncio.Lock, asyncio.Event]:
+        """Return the reload primitives, creating them on first use.
+
+        Returns:
+            Tuple of (reload lock, ready event).
+        """
+        if self._reload_lock is None or self._ready_event is None:
+            ready_event = asyncio.Event()
+            ready_event.set()
+            self._reload_lock = asyncio.Lock()
+            self._ready_event = ready_event
+        return self._reload_lock, self._ready_event
@@ -3,8 +3,10 @@
 This module defines the fundamental building blocks of the OpenCuff plugin system:
     - PluginState: Enumeration of plugin lifecycle states
     - ToolDefinition: Describes a tool provided by a plugin
+    - freeze_schemas: Make a shared ToolDefinition's schemas read-only
     - ToolResult: Result of a tool invocation
     - DiscoveryResult: Result of plugin discovery for a directory
+    - DiscoveryContext: Shared directory snapshot used during discovery
     - CLIArgument: Definition of a positional CLI argument
     - CLIOption: Definition of a CLI option/flag
     - CLICommand: Definition of a CLI command exposed by a plugin
@@ -12,17 +14,26 @@ This module defines the fundamental building blocks of the OpenCuff plugin syste
     - InSourcePlugin: Base class for in-source Python plugins
 """
 
+import fnmatch
+import os
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+# Shared read-only default for schemas a ToolDefinition doesn't specify
+_EMPTY_SCHEMA: Mapping[str, Any] = MappingProxyType({})
 
-class PluginState(str, Enum):
+
+class PluginState(Enum):
     """Lifecycle states for a plugin.
 
+    Members compare by identity; use `.value` for the string form when
+    serializing.
+
     State transitions:
         UNLOADED -> INITIALIZING: load() called
         INITIALIZING -> ACTIVE: initialization succeeds
@@ -42,24 +53,62 @@ class PluginState(str, Enum):
     RECOVERING = "recovering"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class ToolDefinition:
     """Describes a tool provided by a plugin.
 
+    Instances should be treated as immutable. This is not enforced at
+    runtime because frozen dataclasses are noticeably slower to construct,
+    and plugins build these in bulk from get_tools(). Definitions shared
+    across calls can opt in to read-only schemas with freeze_schemas().
+    Instances hash by name, since the schema dicts are not hashable.
+
     Attributes:
         name: Unique identifier for the tool within the plugin.
         description: Human-readable description of what the tool does.
         parameters: JSON Schema describing the tool's input parameters.
+            Defaults to a shared, read-only empty mapping.
         returns: JSON Schema describing the tool's return value.
+            Defaults to a shared, read-only empty mapping.
     """
 
     name: str
     description: str
-    parameters: dict[str, Any] = field(default_factory=dict)
-    returns: dict[str, Any] = field(default_factory=dict)
+    # dataclasses rejects unhashable defaults, so the shared mapping is
+    # handed out by a factory rather than allocated per instance
+    parameters: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_SCHEMA)
+    returns: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_SCHEMA)
+
+    def __hash__(self) -> int:
+        """Hash by tool name, consistent with field-wise equality."""
+        return hash(self.name)
+
+
+def freeze_schemas(tool: ToolDefinition) -> ToolDefinition:
+    """Return a copy of a tool definition with read-only top-level schemas.
 
+    Intended for definitions built once and shared by every get_tools()
+    call, such as a plugin's class-level _TOOLS. The parameters and returns
+    mappings are copied and wrapped in MappingProxyType, so callers cannot
+    add, replace or remove keys. Nested values are left as they are.
 
-@dataclass
+    Args:
+        tool: The tool definition to freeze.
+
+    Returns:
+        A new ToolDefinition whose schemas are read-only mappings.
+    """
+    return ToolDefinition(
+        name=tool.name,
+        description=tool.description,
+        parameters=MappingProxyType(dict(tool.parameters))
+        if tool.parameters
+        else _EMPTY_SCHEMA,
+        returns=MappingProxyType(dict(tool.returns)) if tool.returns else _EMPTY_SCHEMA,
+    )
+
+
+@dataclass(slots=True)
 class ToolResult:
     """Result of a tool invocation.
 
@@ -74,7 +123,7 @@ class ToolResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveryResult:
     """Result of plugin discovery for a directory.
 
@@ -91,15 +140,15 @@ class DiscoveryResult:
             directly in settings.yml.
         description: Human-readable description of what was discovered.
         warnings: Warnings about the discovery (e.g., configuration conflicts).
-        discovered_items: List of discovered items (targets, scripts, etc.) for display.
+        discovered_items: Discovered items (targets, scripts, etc.) for display.
     """
 
     applicable: bool
     confidence: float
     suggested_config: dict[str, Any]
     description: str
-    warnings: list[str] = field(default_factory=list)
-    discovered_items: list[str] = field(default_factory=list)
+    warnings: tuple[str, ...] = ()
+    discovered_items: tuple[str, ...] = ()
 
     def __post_init__(self) -> None:
         """Validate field values after initialization."""
@@ -109,7 +158,104 @@ class DiscoveryResult:
             )
 
 
-@dataclass
+@dataclass(slots=True)
+class DiscoveryContext:
+    """Snapshot of a directory shared by all plugins during discovery.
+
+    The directory and each of its direct subdirectories are listed once, so
+    plugins can check for files and match simple glob patterns without each
+    re-scanning the filesystem.
+
+    Attributes:
+        directory: The directory that was scanned.
+        top_level_files: Names of all entries directly inside directory.
+        listings: Entry names in scan order, keyed by subdirectory name
+            ("" for directory itself). Only one level of subdirectories is
+            listed.
+        glob_cache: Results of previous glob() calls, keyed by pattern.
+    """
+
+    directory: Path
+    top_level_files: frozenset[str]
+    listings: dict[str, tuple[str, ...]]
+    glob_cache: dict[str, list[Path]] = field(default_factory=dict)
+
+    @classmethod
+    def scan(cls, directory: Path) -> "DiscoveryContext":
+        """Build a context by listing directory and its direct subdirectories.
+
+        Args:
+            directory: The directory to scan.
+
+        Returns:
+            A DiscoveryContext for the directory.
+
+        Raises:
+            OSError: If directory cannot be listed.
+        """
+        listings: dict[str, tuple[str, ...]] = {}
+        names: list[str] = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                names.append(entry.name)
+                try:
+                    if not entry.is_dir():
+                        continue
+                    with os.scandir(entry.path) as sub:
+                        listings[entry.name] = tuple(child.name for child in sub)
+                except OSError:
+                    continue
+        listings[""] = tuple(names)
+        return cls(
+            directory=directory,
+            top_level_files=frozenset(names),
+            listings=listings,
+        )
+
+    def exists(self, name: str) -> bool:
+        """Check whether an entry exists directly inside the directory.
+
+        Args:
+            name: Entry name (not a path).
+
+        Returns:
+            True if the entry was present when the directory was scanned.
+        """
+        return name in self.top_level_files
+
+    def glob(self, pattern: str) -> list[Path]:
+        """Match a glob pattern against the snapshot.
+
+        Patterns of the form "name" or "subdir/name", where only the last
+        component contains wildcards, are answered from the snapshot. Anything
+        else falls back to Path.glob().
+
+        Args:
+            pattern: Glob pattern relative to the directory.
+
+        Returns:
+            Matching paths, in directory listing order.
+        """
+        cached = self.glob_cache.get(pattern)
+        if cached is not None:
+            return cached
+
+        parent, _, name_pattern = pattern.rpartition("/")
+        if "/" in parent or any(char in parent for char in "*?["):
+            matches = list(self.directory.glob(pattern))
+        else:
+            base = self.directory / parent if parent else self.directory
+            matches = [
+                base / name
+                for name in self.listings.get(parent, ())
+                if fnmatch.fnmatchcase(name, name_pattern)
+            ]
+
+        self.glob_cache[pattern] = matches
+        return matches
+
+
+@dataclass(slots=True)
 class CLIArgument:
     """Definition of a positional CLI argument.
 
@@ -126,7 +272,7 @@ class CLIArgument:
     default: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CLIOption:
     """Definition of a CLI option/flag.
 
@@ -145,7 +291,7 @@ class CLIOption:
     type: type = str
 
 
-@dataclass
+@dataclass(slots=True)
 class CLICommand:
     """Definition of a CLI command exposed by a plugin.
 
@@ -252,15 +398,20 @@ class InSourcePlugin(ABC):
 
     Example:
         class MyPlugin(InSourcePlugin):
-            def get_tools(self) -> list[ToolDefinition]:
-                return [
+            # Static schemas can be built once at class scope
+            _TOOLS = (
+                freeze_schemas(
                     ToolDefinition(
                         name="my_tool",
                         description="Does something useful",
                         parameters={"type": "object"},
                         returns={"type": "string"},
                     )
-                ]
+                ),
+            )
+
+            def get_tools(self) -> list[ToolDefinition]:
+                return list(self._TOOLS)
 
             async def call_tool(
                 self, tool_name: str, arguments: dict
@@ -282,7 +433,9 @@ class InSourcePlugin(ABC):
     def get_tools(self) -> list[ToolDefinition]:
         """Return tools provided by this plugin.
 
-        Subclasses MUST implement this method to define their tools.
+        Subclasses MUST implement this method to define their tools. Tools
+        whose schemas don't depend on configuration can be kept in a
+        class-level tuple and returned as a new list on each call.
 
         Returns:
             List of ToolDefinition objects describing available tools.
@@ -356,7 +509,9 @@ class InSourcePlugin(ABC):
         await self.initialize()
 
     @classmethod
-    def discover(cls, directory: Path) -> DiscoveryResult:
+    def discover(
+        cls, directory: Path, context: DiscoveryContext | None = None
+    ) -> DiscoveryResult:
         """Discover if this plugin is applicable to the given directory.
 
         This is a CLASS METHOD that runs WITHOUT instantiating the plugin.
@@ -372,15 +527,23 @@ class InSourcePlugin(ABC):
 
         Args:
             directory: The directory to scan for applicable files.
+            context: Optional snapshot of directory shared between plugins.
+                When given, use it instead of re-scanning the filesystem.
 
         Returns:
             DiscoveryResult indicating applicability and suggested config.
 
         Example:
             @classmethod
-            def discover(cls, directory: Path) -> DiscoveryResult:
+            def discover(
+                cls, directory: Path, context: DiscoveryContext | None = None
+            ) -> DiscoveryResult:
                 makefile = directory / "Makefile"
-                if not makefile.exists():
+                if context is not None:
+                    found = context.exists("Makefile")
+                else:
+                    found = makefile.exists()
+                if not found:
                     return DiscoveryResult(
                         applicable=False,
                         confidence=0.0,
@@ -397,7 +560,7 @@ class InSourcePlugin(ABC):
                         "targets": "*",
                     },
                     description=f"Found Makefile with {len(targets)} targets",
-                    discovered_items=targets[:10],
+                    discovered_items=tuple(targets[:10]),
                 )
         """
         # Default implementation: plugin does not support discovery
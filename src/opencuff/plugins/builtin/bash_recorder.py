@@ -37,19 +37,29 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
+import gzip
+import itertools
 import json
 import logging
+import operator
 import os
+import secrets
 import shutil
+import stat
 import time
-import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
-from opencuff.plugins.base import InSourcePlugin, ToolDefinition, ToolResult
+from opencuff.plugins.base import (
+    InSourcePlugin,
+    ToolDefinition,
+    ToolResult,
+    freeze_schemas,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +72,18 @@ try:
 except ImportError:
     OPENCUFF_VERSION = "unknown"
 
+# Use orjson to parse session files for list_recent when it is installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore[assignment]
+
+# Both accept bytes; orjson.JSONDecodeError is a ValueError subclass
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 
 # =============================================================================
 # Exceptions
@@ -139,6 +161,11 @@ class RecordingConfig(BaseModel):
         description="Days to retain recordings (0 = forever)",
     )
 
+    compress_on_finalize: bool = Field(
+        default=False,
+        description="Gzip a session's JSONL file when the session is finalized",
+    )
+
 
 class ExecutionConfig(BaseModel):
     """Execution-specific configuration."""
@@ -286,6 +313,57 @@ class RecordingIndex(BaseModel):
     sessions: dict[str, SessionIndexEntry]
 
 
+# Serializers for the write path; dump_json() returns UTF-8 bytes directly
+_ENTRY_ADAPTER = TypeAdapter(RecordingEntry)
+_METADATA_ADAPTER = TypeAdapter(SessionMetadata)
+
+# fdatasync is not available on every platform (e.g. macOS)
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+# Block size used when reading session files backwards for list_recent
+_TAIL_CHUNK_SIZE = 32 * 1024
+
+# How long health probe results (writability, free space) are reused (seconds)
+_HEALTH_PROBE_TTL = 5.0
+
+# Read size when compressing finalized session files
+_COMPRESS_CHUNK_SIZE = 1024 * 1024
+
+
+def _utc_timestamp_id(tm: time.struct_time | None = None) -> str:
+    """Return a UTC time formatted as YYYYMMDD_HHMMSS.
+
+    Formats the struct_time fields directly, which is cheaper than calling
+    strftime() for each part.
+
+    Args:
+        tm: The UTC time to format. Defaults to the current time.
+
+    Returns:
+        The timestamp string used in session and entry IDs.
+    """
+    if tm is None:
+        tm = time.gmtime()
+    return (
+        f"{tm.tm_year:04d}{tm.tm_mon:02d}{tm.tm_mday:02d}_"
+        f"{tm.tm_hour:02d}{tm.tm_min:02d}{tm.tm_sec:02d}"
+    )
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist renames in a directory, where the platform supports it.
+
+    Args:
+        directory: Directory whose entries should be synced.
+    """
+    with contextlib.suppress(OSError):
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
 # =============================================================================
 # Session Manager
 # =============================================================================
@@ -330,30 +408,27 @@ class SessionManager:
     def _generate_session_id(self) -> str:
         """Generate a unique session ID.
 
-        Format: YYYYMMDD_HHMMSS_uuid4_prefix
+        Format: YYYYMMDD_HHMMSS_<12 random hex digits>
 
         Returns:
             A unique session ID string.
         """
-        now = datetime.now(UTC)
-        date_part = now.strftime("%Y%m%d")
-        time_part = now.strftime("%H%M%S")
-        uuid_prefix = str(uuid.uuid4()).replace("-", "")[:12]
-        return f"{date_part}_{time_part}_{uuid_prefix}"
+        random_part = secrets.token_hex(6)
+        return f"{_utc_timestamp_id()}_{random_part}"
 
-    def _generate_entry_id(self) -> str:
+    def _generate_entry_id(self, timestamp: datetime | None = None) -> str:
         """Generate a unique entry ID within the session.
 
         Format: e_YYYYMMDD_HHMMSS_NNN
 
+        Args:
+            timestamp: Time of the entry. Defaults to the current time.
+
         Returns:
             A unique entry ID string.
         """
-        now = datetime.now(UTC)
-        date_part = now.strftime("%Y%m%d")
-        time_part = now.strftime("%H%M%S")
-        seq_num = f"{self._entry_count + 1:03d}"
-        return f"e_{date_part}_{time_part}_{seq_num}"
+        tm = timestamp.utctimetuple() if timestamp is not None else None
+        return f"e_{_utc_timestamp_id(tm)}_{self._entry_count + 1:03d}"
 
     async def start_session(
         self,
@@ -459,13 +534,17 @@ class SessionManager:
         else:
             self._commands_failed += 1
 
-    def get_next_entry_id(self) -> str:
+    def get_next_entry_id(self, timestamp: datetime | None = None) -> str:
         """Get the next entry ID and increment the counter.
 
+        Args:
+            timestamp: Time of the entry, so the ID matches the entry's
+                recorded timestamp. Defaults to the current time.
+
         Returns:
             The next entry ID.
         """
-        entry_id = self._generate_entry_id()
+        entry_id = self._generate_entry_id(timestamp)
         self.increment_entry_count()
         return entry_id
 
@@ -480,9 +559,14 @@ class Recorder:
 
     Responsible for:
     - Creating recording directories with proper permissions
-    - Writing entries atomically with fsync
+    - Writing entries durably, with one fdatasync per batch
     - Managing session metadata files
     - Updating the index file
+
+    Entries written concurrently are group-committed: whichever arrive while
+    a batch is being synced are appended and synced together in the next
+    batch. The session file is kept open in append mode until the session
+    changes or close() is called.
     """
 
     def __init__(
@@ -490,19 +574,31 @@ class Recorder:
         session_manager: SessionManager,
         config: RecordingConfig,
     ) -> None:
-        """Initialize the recorder.
+        """Initialize the recorder and create its directories.
 
         Args:
             session_manager: The session manager instance.
             config: Recording configuration.
+
+        Raises:
+            OSError: If the sessions directory cannot be created.
         """
         self._session_manager = session_manager
         self._config = config
-        self._initialized = False
+        self._pending: list[tuple[Path, bytes, asyncio.Future[None]]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._fd: int | None = None
+        self._fd_path: Path | None = None
+        self._sessions_dir = config.directory / "sessions"
+        # (session ID, JSONL path, metadata path) for the last session seen
+        self._session_paths: tuple[str | None, Path, Path] | None = None
+
+        # Done once here so the write paths don't need to check for it
+        self._ensure_directories()
 
     def _ensure_directories(self) -> None:
         """Ensure recording directories exist with proper permissions."""
-        sessions_dir = self._config.directory / "sessions"
+        sessions_dir = self._sessions_dir
 
         if not sessions_dir.exists():
             # Create with restrictive permissions (0700)
@@ -512,7 +608,26 @@ class Recorder:
             with contextlib.suppress(OSError):
                 sessions_dir.chmod(0o700)
 
-        self._initialized = True
+    def _get_paths_for_session(self, session_id: str | None) -> tuple[Path, Path]:
+        """Get the JSONL and metadata file paths for a session.
+
+        The paths are built once and reused until the session ID changes.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            Tuple of (session file path, metadata file path).
+        """
+        cached = self._session_paths
+        if cached is None or cached[0] != session_id:
+            cached = (
+                session_id,
+                self._sessions_dir / f"{session_id}.jsonl",
+                self._sessions_dir / f"{session_id}.meta.json",
+            )
+            self._session_paths = cached
+        return cached[1], cached[2]
 
     def _get_session_file_path(self) -> Path:
         """Get the path to the current session's JSONL file.
@@ -521,7 +636,7 @@ class Recorder:
             Path to the session file.
         """
         session_id = self._session_manager.current_session_id
-        return self._config.directory / "sessions" / f"{session_id}.jsonl"
+        return self._get_paths_for_session(session_id)[0]
 
     def _get_metadata_file_path(self) -> Path:
         """Get the path to the current session's metadata file.
@@ -530,12 +645,12 @@ class Recorder:
             Path to the metadata file.
         """
         session_id = self._session_manager.current_session_id
-        return self._config.directory / "sessions" / f"{session_id}.meta.json"
+        return self._get_paths_for_session(session_id)[1]
 
     async def write_entry(self, entry: RecordingEntry) -> None:
         """Write a recording entry to the session file.
 
-        Uses atomic write pattern with fsync for durability.
+        Returns once the entry has been appended and synced to disk.
 
         Args:
             entry: The recording entry to write.
@@ -543,15 +658,16 @@ class Recorder:
         Raises:
             RecordingError: If the write fails.
         """
-        if not self._initialized:
-            self._ensure_directories()
-
         session_file = self._get_session_file_path()
-        entry_json = entry.model_dump_json() + "\n"
+        entry_json = _ENTRY_ADAPTER.dump_json(entry) + b"\n"
+
+        written: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending.append((session_file, entry_json, written))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._drain_pending())
 
         try:
-            # Use asyncio.to_thread for file I/O to avoid blocking
-            await asyncio.to_thread(self._write_entry_sync, session_file, entry_json)
+            await written
         except OSError as e:
             logger.error(
                 "recording_write_failed",
@@ -563,21 +679,86 @@ class Recorder:
             )
             raise RecordingError(f"Failed to write recording entry: {e}") from e
 
-    def _write_entry_sync(self, file_path: Path, content: str) -> None:
-        """Synchronous entry write with fsync.
+    async def flush(self) -> None:
+        """Wait until all pending entries have been written."""
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+
+    async def close(self) -> None:
+        """Write pending entries and close the session file."""
+        await self.flush()
+        self._close_session_file()
+
+    async def _drain_pending(self) -> None:
+        """Write queued entries in batches until the queue is empty."""
+        while self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                # Use asyncio.to_thread for file I/O to avoid blocking
+                await asyncio.to_thread(
+                    self._write_batch_sync,
+                    [(path, content) for path, content, _ in batch],
+                )
+            except Exception as e:
+                for _, _, written in batch:
+                    if not written.done():
+                        written.set_exception(e)
+            else:
+                for _, _, written in batch:
+                    if not written.done():
+                        written.set_result(None)
+
+    def _write_batch_sync(self, batch: list[tuple[Path, bytes]]) -> None:
+        """Append a batch of entries and sync each file once.
+
+        Entries stay in order. A batch only spans files when the session
+        changed while it was queued.
 
         Args:
-            file_path: Path to write to.
-            content: Content to write.
+            batch: (file path, encoded entry) pairs to write.
         """
-        with open(file_path, "a") as f:
-            f.write(content)
-            f.flush()
-            os.fsync(f.fileno())
+        for file_path, group in itertools.groupby(batch, key=operator.itemgetter(0)):
+            fd = self._open_session_file(file_path)
+            data = memoryview(b"".join(content for _, content in group))
+            while data:
+                data = data[os.write(fd, data) :]
+            # Appends only change the size, which fdatasync still flushes
+            _fdatasync(fd)
 
-        # Set file permissions to 0600 (owner read/write only)
+    def _open_session_file(self, file_path: Path) -> int:
+        """Return an append-mode descriptor for a session file.
+
+        The descriptor is reused until a different file is requested.
+
+        Args:
+            file_path: Path of the session file.
+
+        Returns:
+            The open file descriptor.
+        """
+        if self._fd is not None and self._fd_path == file_path:
+            return self._fd
+
+        self._close_session_file()
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+        fd = os.open(file_path, flags, 0o600)
+
+        # Set file permissions to 0600 (owner read/write only); O_CREAT's
+        # mode does not apply to files that already existed
         with contextlib.suppress(OSError):
-            file_path.chmod(0o600)
+            os.fchmod(fd, 0o600)
+
+        self._fd = fd
+        self._fd_path = file_path
+        return fd
+
+    def _close_session_file(self) -> None:
+        """Close the open session file descriptor, if any."""
+        if self._fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+            self._fd = None
+            self._fd_path = None
 
     async def write_session_metadata(self, metadata: SessionMetadata) -> None:
         """Write session metadata to file.
@@ -585,13 +766,8 @@ class Recorder:
         Args:
             metadata: The session metadata to write.
         """
-        if not self._initialized:
-            self._ensure_directories()
-
-        metadata_file = (
-            self._config.directory / "sessions" / f"{metadata.session_id}.meta.json"
-        )
-        metadata_json = metadata.model_dump_json(indent=2)
+        metadata_file = self._get_paths_for_session(metadata.session_id)[1]
+        metadata_json = _METADATA_ADAPTER.dump_json(metadata, indent=2)
 
         try:
             await asyncio.to_thread(
@@ -606,20 +782,97 @@ class Recorder:
                 },
             )
 
-    def _write_metadata_sync(self, file_path: Path, content: str) -> None:
-        """Synchronous metadata write.
+    def _write_metadata_sync(self, file_path: Path, content: bytes) -> None:
+        """Synchronous atomic metadata write.
+
+        Writes to a temporary file next to the target and renames it into
+        place, so readers never see a partially written metadata file.
 
         Args:
             file_path: Path to write to.
-            content: Content to write.
+            content: Encoded content to write.
         """
-        with open(file_path, "w") as f:
-            f.write(content)
-            f.flush()
-            os.fsync(f.fileno())
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
 
-        with contextlib.suppress(OSError):
-            file_path.chmod(0o600)
+        # Create with 0600 (owner read/write only) so the file is never
+        # readable by others, even before the rename
+        fd = os.open(tmp_path, flags, 0o600)
+        try:
+            with open(fd, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            with contextlib.suppress(OSError):
+                tmp_path.chmod(0o600)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            raise
+
+        _fsync_directory(file_path.parent)
+
+    async def compress_session_file(self, session_id: str) -> None:
+        """Replace a finalized session's JSONL file with a gzip copy.
+
+        Must only be called once no more entries will be written to the
+        session. Failures are logged and leave the plain file in place.
+
+        Args:
+            session_id: ID of the finalized session.
+        """
+        session_file = self._get_paths_for_session(session_id)[0]
+        if self._fd_path == session_file:
+            self._close_session_file()
+
+        try:
+            await asyncio.to_thread(self._compress_file_sync, session_file)
+        except OSError as e:
+            logger.error(
+                "session_compress_failed",
+                extra={
+                    "session_id": session_id,
+                    "error": str(e),
+                },
+            )
+
+    def _compress_file_sync(self, file_path: Path) -> None:
+        """Synchronously gzip a file next to itself and remove the original.
+
+        The compressed file is written under a temporary name and renamed
+        into place, so a crash never leaves a truncated .gz behind.
+
+        Args:
+            file_path: File to compress.
+        """
+        if not file_path.exists():
+            return
+
+        gz_path = file_path.with_name(file_path.name + ".gz")
+        tmp_path = gz_path.with_name(gz_path.name + ".tmp")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+        fd = os.open(tmp_path, flags, 0o600)
+        try:
+            with open(fd, "wb") as raw, open(file_path, "rb") as source:
+                # Level 1 keeps finalize fast; text output still shrinks well
+                with gzip.GzipFile(
+                    filename=file_path.name, mode="wb", fileobj=raw, compresslevel=1
+                ) as compressed:
+                    shutil.copyfileobj(source, compressed, _COMPRESS_CHUNK_SIZE)
+                raw.flush()
+                os.fsync(raw.fileno())
+            with contextlib.suppress(OSError):
+                tmp_path.chmod(0o600)
+            os.replace(tmp_path, gz_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            raise
+
+        _fsync_directory(file_path.parent)
+        file_path.unlink()
 
 
 # =============================================================================
@@ -638,6 +891,13 @@ class Plugin(InSourcePlugin):
 
     PLUGIN_VERSION = PLUGIN_VERSION
 
+    # Dispatch table mapping tool names to handler method names
+    _TOOL_HANDLERS: dict[str, str] = {
+        "execute": "_handle_execute",
+        "session_info": "_handle_session_info",
+        "list_recent": "_handle_list_recent",
+    }
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the BashRecorder plugin.
 
@@ -650,6 +910,12 @@ class Plugin(InSourcePlugin):
         self._recorder: Recorder | None = None
         self._recording_enabled: bool = True
         self._initialized = False
+        # Environment for child processes, built on first use (see _build_env)
+        self._command_env: dict[str, str] | None = None
+        # (monotonic time, result) of the last recording directory probe
+        self._writable_cache: tuple[float, bool] | None = None
+        # (monotonic time, free bytes or None if unknown) of the last usage probe
+        self._disk_free_cache: tuple[float, int | None] | None = None
 
     async def initialize(self) -> None:
         """Initialize plugin resources.
@@ -682,11 +948,16 @@ class Plugin(InSourcePlugin):
 
         Finalizes current recording session and flushes pending writes.
         """
+        if self._recorder:
+            await self._recorder.close()
+
         if self._session_manager:
             metadata = await self._session_manager.finalize_session(status="shutdown")
             if metadata and self._recorder:
                 await self._recorder.write_session_metadata(metadata)
+            await self._compress_finalized_session(metadata)
 
+        self._command_env = None
         self._initialized = False
         logger.info("plugin_shutdown")
 
@@ -737,13 +1008,27 @@ class Plugin(InSourcePlugin):
         Args:
             new_config: New configuration dictionary.
         """
+        # Nothing below acts on an unchanged config, so skip revalidating it
+        if new_config == self.config:
+            return
+
         old_config = self._plugin_config
         self._plugin_config = BashRecorderConfig.model_validate(new_config)
 
+        if self._plugin_config.execution != old_config.execution:
+            self._command_env = None
+
         # Handle recording directory change
         if self._plugin_config.recording.directory != old_config.recording.directory:
+            self._writable_cache = None
+            self._disk_free_cache = None
+            if self._recorder:
+                await self._recorder.close()
             if self._session_manager:
-                await self._session_manager.finalize_session(status="config_reload")
+                metadata = await self._session_manager.finalize_session(
+                    status="config_reload"
+                )
+                await self._compress_finalized_session(metadata)
             self._ensure_recording_directory()
             self._session_manager = SessionManager(self._plugin_config.recording)
             self._recorder = Recorder(
@@ -754,25 +1039,39 @@ class Plugin(InSourcePlugin):
 
         # Handle recording enable/disable
         if not self._plugin_config.recording.enabled and old_config.recording.enabled:
+            if self._recorder:
+                await self._recorder.close()
             if self._session_manager:
-                await self._session_manager.finalize_session(
+                metadata = await self._session_manager.finalize_session(
                     status="recording_disabled"
                 )
+                await self._compress_finalized_session(metadata)
             self._recording_enabled = False
 
         self.config = new_config
 
+    async def _compress_finalized_session(
+        self, metadata: SessionMetadata | None
+    ) -> None:
+        """Compress a just-finalized session file if configured to.
+
+        Args:
+            metadata: Metadata returned by finalize_session, if any.
+        """
+        if (
+            metadata
+            and self._recorder
+            and self._plugin_config.recording.compress_on_finalize
+        ):
+            await self._recorder.compress_session_file(metadata.session_id)
+
     def get_tools(self) -> list[ToolDefinition]:
         """Return available tools.
 
         Returns:
             List of tool definitions.
         """
-        return [
-            self._get_execute_tool_definition(),
-            self._get_session_info_tool_definition(),
-            self._get_list_recent_tool_definition(),
-        ]
+        return list(self._tool_definitions())
 
     async def call_tool(
         self,
@@ -788,26 +1087,31 @@ class Plugin(InSourcePlugin):
         Returns:
             ToolResult with execution outcome.
         """
-        handlers = {
-            "execute": self._handle_execute,
-            "session_info": self._handle_session_info,
-            "list_recent": self._handle_list_recent,
-        }
-
-        handler = handlers.get(tool_name)
-        if not handler:
+        handler_name = self._TOOL_HANDLERS.get(tool_name)
+        if not handler_name:
             return ToolResult(
                 success=False,
                 error=f"Unknown tool: {tool_name}",
             )
 
-        return await handler(arguments)
+        return await getattr(self, handler_name)(arguments)
 
     # =========================================================================
     # Tool Definitions
     # =========================================================================
 
-    def _get_execute_tool_definition(self) -> ToolDefinition:
+    @staticmethod
+    @functools.cache
+    def _tool_definitions() -> tuple[ToolDefinition, ...]:
+        """Build the tool definitions once; their schemas are static."""
+        return (
+            freeze_schemas(Plugin._get_execute_tool_definition()),
+            freeze_schemas(Plugin._get_session_info_tool_definition()),
+            freeze_schemas(Plugin._get_list_recent_tool_definition()),
+        )
+
+    @staticmethod
+    def _get_execute_tool_definition() -> ToolDefinition:
         """Get the execute tool definition."""
         return ToolDefinition(
             name="execute",
@@ -869,7 +1173,8 @@ Returns:
             },
         )
 
-    def _get_session_info_tool_definition(self) -> ToolDefinition:
+    @staticmethod
+    def _get_session_info_tool_definition() -> ToolDefinition:
         """Get the session_info tool definition."""
         return ToolDefinition(
             name="session_info",
@@ -888,7 +1193,8 @@ Returns:
             },
         )
 
-    def _get_list_recent_tool_definition(self) -> ToolDefinition:
+    @staticmethod
+    def _get_list_recent_tool_definition() -> ToolDefinition:
         """Get the list_recent tool definition."""
         return ToolDefinition(
             name="list_recent",
@@ -947,13 +1253,15 @@ Returns:
         # Get working directory
         working_directory = arguments.get("working_directory")
         if working_directory:
-            work_dir = Path(working_directory)
-            if not work_dir.exists():
+            # One stat answers both questions
+            try:
+                is_dir = stat.S_ISDIR(os.stat(working_directory).st_mode)
+            except (OSError, ValueError):
                 return ToolResult(
                     success=False,
                     error=f"Working directory does not exist: {working_directory}",
                 )
-            if not work_dir.is_dir():
+            if not is_dir:
                 return ToolResult(
                     success=False,
                     error=f"Working directory is not a directory: {working_directory}",
@@ -962,13 +1270,13 @@ Returns:
             working_directory = (
                 str(self._plugin_config.execution.working_directory)
                 if self._plugin_config.execution.working_directory
-                else str(Path.cwd())
+                else os.getcwd()
             )
 
         description = arguments.get("description")
 
-        # Execute the command
-        start_time = time.time()
+        # Execute the command; a monotonic clock is immune to wall-clock steps
+        start_ns = time.perf_counter_ns()
         try:
             result = await self._execute_command(
                 command=command,
@@ -985,7 +1293,7 @@ Returns:
                 error=f"Command execution failed: {e}",
             )
 
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         # Record the execution (graceful degradation)
         recording_id: str | None = None
@@ -1098,38 +1406,86 @@ Returns:
     def _read_recent_entries(self, file_path: Path, count: int) -> list[dict[str, Any]]:
         """Read recent entries from a session file.
 
+        The file is read backwards in fixed-size blocks, so the cost depends
+        on the size of the entries returned rather than the session length.
+        Malformed lines are skipped.
+
         Args:
             file_path: Path to the session JSONL file.
             count: Number of entries to return.
 
         Returns:
-            List of entry dictionaries.
+            List of entry dictionaries, oldest first.
         """
-        entries = []
-        with open(file_path) as f:
-            for line in f:
-                if line.strip():
+        entries: list[dict[str, Any]] = []
+        with open(file_path, "rb") as f:
+            position = f.seek(0, os.SEEK_END)
+            # Pieces of the line that continues past the current block, newest
+            # first; joined only once the line's start has been read
+            partial: list[bytes] = []
+
+            while position > 0 and len(entries) < count:
+                read_size = min(_TAIL_CHUNK_SIZE, position)
+                position -= read_size
+                f.seek(position)
+                block = f.read(read_size)
+
+                # A block with no newline lies inside a single long line
+                if position > 0 and b"\n" not in block:
+                    partial.append(block)
+                    continue
+
+                lines = block.split(b"\n")
+                lines[-1] = b"".join([lines[-1], *reversed(partial)])
+
+                # Unless this block starts the file, its first line may
+                # begin in an earlier block
+                partial = [lines.pop(0)] if position > 0 else []
+
+                for line in reversed(lines):
+                    if not line.strip():
+                        continue
                     try:
-                        entry = json.loads(line)
-                        entries.append(
-                            {
-                                "entry_id": entry.get("entry_id"),
-                                "command": entry.get("command"),
-                                "exit_code": entry.get("exit_code"),
-                                "duration_ms": entry.get("duration_ms"),
-                                "timestamp": entry.get("timestamp"),
-                            }
-                        )
-                    except json.JSONDecodeError:
+                        entry = _json_loads(line)
+                    except ValueError:
                         continue
+                    entries.append(
+                        {
+                            "entry_id": entry.get("entry_id"),
+                            "command": entry.get("command"),
+                            "exit_code": entry.get("exit_code"),
+                            "duration_ms": entry.get("duration_ms"),
+                            "timestamp": entry.get("timestamp"),
+                        }
+                    )
+                    if len(entries) == count:
+                        break
 
-        # Return the last 'count' entries
-        return entries[-count:]
+        entries.reverse()
+        return entries
 
     # =========================================================================
     # Command Execution
     # =========================================================================
 
+    def _build_env(self) -> dict[str, str]:
+        """Return the environment for executed commands.
+
+        The parent environment (when inherited) is merged with the configured
+        overrides once and reused until the execution config changes or the
+        plugin shuts down. Changes made to os.environ in the meantime are not
+        picked up.
+
+        Returns:
+            Environment mapping shared between commands; do not mutate it.
+        """
+        if self._command_env is None:
+            execution = self._plugin_config.execution
+            env = dict(os.environ) if execution.inherit_env else {}
+            env.update(execution.env_overrides)
+            self._command_env = env
+        return self._command_env
+
     async def _execute_command(
         self,
         command: str,
@@ -1146,10 +1502,6 @@ Returns:
         Returns:
             Dictionary with stdout, stderr, exit_code, and timed_out.
         """
-        # Build environment
-        env = os.environ.copy() if self._plugin_config.execution.inherit_env else {}
-        env.update(self._plugin_config.execution.env_overrides)
-
         shell = self._plugin_config.execution.shell
 
         try:
@@ -1158,7 +1510,7 @@ Returns:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=working_directory,
-                env=env,
+                env=self._build_env(),
                 executable=shell,
             )
 
@@ -1231,55 +1583,64 @@ Returns:
         if not self._session_manager or not self._recorder:
             raise RecordingError("Recording not initialized")
 
-        entry_id = self._session_manager.get_next_entry_id()
-
-        # Truncate output if necessary
-        max_size = self._plugin_config.recording.max_output_size
-        stdout_truncated = len(stdout.encode("utf-8")) > max_size
-        stderr_truncated = len(stderr.encode("utf-8")) > max_size
-
-        original_stdout_bytes = len(stdout.encode("utf-8"))
-        original_stderr_bytes = len(stderr.encode("utf-8"))
+        # One clock reading serves both the entry ID and its timestamp
+        timestamp = datetime.now(UTC)
+        entry_id = self._session_manager.get_next_entry_id(timestamp)
 
+        # Truncate output if necessary. With capture disabled no output is
+        # recorded, so it is not measured either and never marked truncated.
         recorded_stdout: str | None = None
         recorded_stderr: str | None = None
+        output_truncated = False
+        output_truncated_bytes: int | None = None
 
         if self._plugin_config.recording.capture_output:
+            # Encode each stream once; the bytes serve the size check and slice
+            max_size = self._plugin_config.recording.max_output_size
+            stdout_bytes = stdout.encode("utf-8")
+            stderr_bytes = stderr.encode("utf-8")
+
+            original_stdout_bytes = len(stdout_bytes)
+            original_stderr_bytes = len(stderr_bytes)
+
+            stdout_truncated = original_stdout_bytes > max_size
+            stderr_truncated = original_stderr_bytes > max_size
+
             if stdout_truncated:
-                recorded_stdout = stdout.encode("utf-8")[:max_size].decode(
+                recorded_stdout = stdout_bytes[:max_size].decode(
                     "utf-8", errors="replace"
                 )
             else:
                 recorded_stdout = stdout
 
             if stderr_truncated:
-                recorded_stderr = stderr.encode("utf-8")[:max_size].decode(
+                recorded_stderr = stderr_bytes[:max_size].decode(
                     "utf-8", errors="replace"
                 )
             else:
                 recorded_stderr = stderr
 
-        output_truncated = stdout_truncated or stderr_truncated
-        output_truncated_bytes = (
-            max(original_stdout_bytes, original_stderr_bytes)
-            if output_truncated
-            else None
-        )
+            output_truncated = stdout_truncated or stderr_truncated
+            if output_truncated:
+                output_truncated_bytes = max(
+                    original_stdout_bytes, original_stderr_bytes
+                )
 
         # Capture environment if configured
         environment: dict[str, str] | None = None
         if self._plugin_config.recording.capture_env:
+            # Walk the short allowlist rather than the whole environment
             environment = {
-                k: v
-                for k, v in os.environ.items()
-                if k in self._plugin_config.recording.env_allowlist
+                k: os.environ[k]
+                for k in self._plugin_config.recording.env_allowlist
+                if k in os.environ
             }
 
         entry = RecordingEntry(
             entry_id=entry_id,
             session_id=self._session_manager.current_session_id,
             sequence_number=self._session_manager.entry_count,
-            timestamp=datetime.now(UTC),
+            timestamp=timestamp,
             duration_ms=duration_ms,
             command=command,
             description=description,
@@ -1323,6 +1684,25 @@ Returns:
     def _check_directory_writable(self) -> bool:
         """Check if the recording directory is writable.
 
+        The result is reused for _HEALTH_PROBE_TTL seconds so frequent health
+        polling does not create and delete a probe file on every call.
+
+        Returns:
+            True if writable, False otherwise.
+        """
+        now = time.monotonic()
+        if self._writable_cache is not None:
+            checked_at, writable = self._writable_cache
+            if now - checked_at < _HEALTH_PROBE_TTL:
+                return writable
+
+        writable = self._probe_directory_writable()
+        self._writable_cache = (now, writable)
+        return writable
+
+    def _probe_directory_writable(self) -> bool:
+        """Test the recording directory for writability without caching.
+
         Returns:
             True if writable, False otherwise.
         """
@@ -1335,6 +1715,10 @@ Returns:
             except OSError:
                 return False
 
+        # Permission bits rule most failures out without touching the disk
+        if not os.access(sessions_dir, os.W_OK | os.X_OK):
+            return False
+
         # Try to write a test file
         test_file = sessions_dir / ".write_test"
         try:
@@ -1347,7 +1731,8 @@ Returns:
     def _check_disk_space(self, min_bytes: int = 10_000_000) -> bool:
         """Check if there's sufficient disk space.
 
-        Uses shutil.disk_usage() for cross-platform compatibility.
+        Uses shutil.disk_usage() for cross-platform compatibility. The free
+        space reading is reused for _HEALTH_PROBE_TTL seconds.
 
         Args:
             min_bytes: Minimum required bytes (default: 10MB).
@@ -1355,16 +1740,31 @@ Returns:
         Returns:
             True if sufficient space, False otherwise.
         """
+        now = time.monotonic()
+        cached = self._disk_free_cache
+        if cached is not None and now - cached[0] < _HEALTH_PROBE_TTL:
+            free = cached[1]
+        else:
+            free = self._probe_disk_free()
+            self._disk_free_cache = (now, free)
+
+        # If we can't check, assume it's OK
+        return free is None or free >= min_bytes
+
+    def _probe_disk_free(self) -> int | None:
+        """Read free space on the recording directory's filesystem.
+
+        Returns:
+            Free bytes, or None if the usage could not be read.
+        """
         try:
             recordings_dir = self._plugin_config.recording.directory
             if not recordings_dir.exists():
                 recordings_dir = recordings_dir.parent
 
-            usage = shutil.disk_usage(recordings_dir)
-            return usage.free >= min_bytes
+            return shutil.disk_usage(recordings_dir).free
         except OSError:
-            # If we can't check, assume it's OK
-            return True
+            return None
 
 
 # Alias for compatibility
@@ -17,7 +17,12 @@ Example configuration:
 import asyncio
 from typing import Any
 
-from opencuff.plugins.base import InSourcePlugin, ToolDefinition, ToolResult
+from opencuff.plugins.base import (
+    InSourcePlugin,
+    ToolDefinition,
+    ToolResult,
+    freeze_schemas,
+)
 
 
 class Plugin(InSourcePlugin):
@@ -30,33 +35,11 @@ class Plugin(InSourcePlugin):
         prefix: Optional prefix string added to echo output.
     """
 
-    def __init__(self, config: dict[str, Any]) -> None:
-        """Initialize the dummy plugin.
-
-        Args:
-            config: Plugin configuration containing optional 'prefix'.
-        """
-        super().__init__(config)
-        self._prefix = config.get("prefix", "")
-        self._initialized = False
-
-    async def initialize(self) -> None:
-        """Initialize the plugin."""
-        # Re-read prefix from config in case it changed during reload
-        self._prefix = self.config.get("prefix", "")
-        self._initialized = True
-
-    async def shutdown(self) -> None:
-        """Shutdown the plugin."""
-        self._initialized = False
-
-    async def health_check(self) -> bool:
-        """Check if the plugin is healthy."""
-        return self._initialized
-
-    def get_tools(self) -> list[ToolDefinition]:
-        """Return the list of tools provided by this plugin."""
-        return [
+    # The tool schemas are static, so they are built once and shared by
+    # every instance and every get_tools() call. Freezing them keeps one
+    # caller from changing the schemas every other caller sees.
+    _TOOLS: tuple[ToolDefinition, ...] = (
+        freeze_schemas(
             ToolDefinition(
                 name="echo",
                 description="Echo the input message back",
@@ -71,7 +54,9 @@ class Plugin(InSourcePlugin):
                     "required": ["message"],
                 },
                 returns={"type": "string"},
-            ),
+            )
+        ),
+        freeze_schemas(
             ToolDefinition(
                 name="add",
                 description="Add two numbers together",
@@ -90,7 +75,9 @@ class Plugin(InSourcePlugin):
                     "required": ["a", "b"],
                 },
                 returns={"type": "integer"},
-            ),
+            )
+        ),
+        freeze_schemas(
             ToolDefinition(
                 name="slow",
                 description="Sleep for a specified duration then return",
@@ -105,8 +92,44 @@ class Plugin(InSourcePlugin):
                     "required": ["seconds"],
                 },
                 returns={"type": "string"},
-            ),
-        ]
+            )
+        ),
+    )
+
+    # Dispatch table mapping tool names to handler method names
+    _TOOL_HANDLERS: dict[str, str] = {
+        "echo": "_echo",
+        "add": "_add",
+        "slow": "_slow",
+    }
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Initialize the dummy plugin.
+
+        Args:
+            config: Plugin configuration containing optional 'prefix'.
+        """
+        super().__init__(config)
+        self._prefix = config.get("prefix", "")
+        self._initialized = False
+
+    async def initialize(self) -> None:
+        """Initialize the plugin."""
+        # Re-read prefix from config in case it changed during reload
+        self._prefix = self.config.get("prefix", "")
+        self._initialized = True
+
+    async def shutdown(self) -> None:
+        """Shutdown the plugin."""
+        self._initialized = False
+
+    async def health_check(self) -> bool:
+        """Check if the plugin is healthy."""
+        return self._initialized
+
+    def get_tools(self) -> list[ToolDefinition]:
+        """Return the list of tools provided by this plugin."""
+        return list(self._TOOLS)
 
     async def call_tool(
         self,
@@ -130,21 +153,14 @@ class Plugin(InSourcePlugin):
                 error="Plugin not initialized",
             )
 
-        # Dispatch table mapping tool names to handlers
-        tool_handlers = {
-            "echo": self._echo,
-            "add": self._add,
-            "slow": self._slow,
-        }
-
-        handler = tool_handlers.get(tool_name)
-        if handler is None:
+        handler_name = self._TOOL_HANDLERS.get(tool_name)
+        if handler_name is None:
             return ToolResult(
                 success=False,
                 error=f"Unknown tool: {tool_name}",
             )
 
-        return await handler(arguments)
+        return await getattr(self, handler_name)(arguments)
 
     async def _echo(self, arguments: dict[str, Any]) -> ToolResult:
         """Echo the input message.
@@ -31,6 +31,7 @@ from __future__ import annotations
 
 import asyncio
 import fnmatch
+import functools
 import hashlib
 import logging
 import os
@@ -50,6 +51,7 @@ from opencuff.plugins.base import (
     CLIArgument,
     CLICommand,
     CLIOption,
+    DiscoveryContext,
     DiscoveryResult,
     InSourcePlugin,
     ToolDefinition,
@@ -307,11 +309,46 @@ class ExtractorError(Exception):
 # =============================================================================
 
 
+# Characters that make an fnmatch pattern more than a literal name
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _split_patterns(
+    patterns: list[str],
+) -> tuple[frozenset[str], re.Pattern[str] | None]:
+    """Split fnmatch patterns into literal names and compiled wildcards.
+
+    Args:
+        patterns: fnmatch patterns to split.
+
+    Returns:
+        Tuple of (literal names, regex for the wildcard patterns or None).
+    """
+    literals = frozenset(p for p in patterns if _GLOB_CHARS.isdisjoint(p))
+    return literals, _compile_patterns([p for p in patterns if p not in literals])
+
+
+def _compile_patterns(patterns: list[str]) -> re.Pattern[str] | None:
+    """Compile fnmatch patterns into one case-sensitive regex.
+
+    Args:
+        patterns: fnmatch patterns to combine.
+
+    Returns:
+        A regex matching any of the patterns, or None if there are none.
+    """
+    if not patterns:
+        return None
+    # translate() anchors each pattern at the end, so alternatives can't bleed
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
 class TargetFilter:
     """Filters targets based on include/exclude patterns.
 
     Uses fnmatch (Unix shell-style wildcards), NOT regex.
     Supported patterns: *, ?, [seq], [!seq]
+    Matching is case-sensitive on every platform, like make target names.
     """
 
     def __init__(
@@ -328,6 +365,10 @@ class TargetFilter:
         self.include_patterns = include_patterns or ["*"]
         self.exclude_patterns = exclude_patterns or []
 
+        # Plain names are set lookups; the wildcards share one regex per list
+        self._include_names, self._include_re = _split_patterns(self.include_patterns)
+        self._exclude_names, self._exclude_re = _split_patterns(self.exclude_patterns)
+
     def matches(self, target_name: str) -> bool:
         """Check if target matches filter criteria.
 
@@ -340,16 +381,17 @@ class TargetFilter:
             True if the target should be included, False otherwise.
         """
         # First check exclude patterns
-        for pattern in self.exclude_patterns:
-            if fnmatch.fnmatch(target_name, pattern):
-                return False
+        if target_name in self._exclude_names:
+            return False
+        if self._exclude_re is not None and self._exclude_re.match(target_name):
+            return False
 
         # Then check include patterns
-        for pattern in self.include_patterns:
-            if fnmatch.fnmatch(target_name, pattern):
-                return True
-
-        return False
+        if target_name in self._include_names:
+            return True
+        return self._include_re is not None and bool(
+            self._include_re.match(target_name)
+        )
 
     @classmethod
     def from_config(cls, config: MakefilePluginConfig) -> TargetFilter:
@@ -1083,6 +1125,46 @@ class TargetCache:
             del self._cache[makefile_path]
 
 
+# =============================================================================
+# Discovery Helpers
+# =============================================================================
+
+# Simple regex to match target definitions (excluding assignments like :=)
+_STATIC_TARGET_PATTERN = re.compile(
+    r"^([a-zA-Z_][a-zA-Z0-9_.-]*)\s*:(?!=)", re.MULTILINE
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _extract_targets_cached(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Extract target names from a Makefile, memoized on its stat signature.
+
+    The mtime and size are part of the cache key so an edited Makefile is
+    re-parsed on the next call.
+
+    Args:
+        path: Path to the Makefile.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: Size of the file in bytes.
+
+    Returns:
+        Target names in definition order, excluding internal (dot) targets.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    content = Path(path).read_text()
+
+    # Filter out internal targets (starting with .) and deduplicate
+    return tuple(
+        dict.fromkeys(
+            name
+            for name in _STATIC_TARGET_PATTERN.findall(content)
+            if not name.startswith(".")
+        )
+    )
+
+
 # =============================================================================
 # Plugin Implementation
 # =============================================================================
@@ -1602,7 +1684,9 @@ class Plugin(InSourcePlugin):
     # =========================================================================
 
     @classmethod
-    def discover(cls, directory: Path) -> DiscoveryResult:
+    def discover(
+        cls, directory: Path, context: DiscoveryContext | None = None
+    ) -> DiscoveryResult:
         """Discover if this plugin is applicable to the given directory.
 
         Checks for Makefile, makefile, or GNUmakefile in the directory.
@@ -1611,6 +1695,7 @@ class Plugin(InSourcePlugin):
 
         Args:
             directory: The directory to scan for Makefiles.
+            context: Optional shared snapshot of directory.
 
         Returns:
             DiscoveryResult with applicability and suggested configuration.
@@ -1619,7 +1704,11 @@ class Plugin(InSourcePlugin):
 
         for name in makefile_names:
             makefile_path = directory / name
-            if makefile_path.exists():
+            if context is not None:
+                found = context.exists(name)
+            else:
+                found = makefile_path.exists()
+            if found:
                 targets = cls._extract_targets_static(makefile_path)
 
                 # Build tool names as they would appear in the MCP server
@@ -1638,7 +1727,7 @@ class Plugin(InSourcePlugin):
                         "working_directory": ".",
                     },
                     description=f"Found {name} with {len(targets)} targets",
-                    discovered_items=tool_names,
+                    discovered_items=tuple(tool_names),
                 )
 
         return DiscoveryResult(
@@ -1662,24 +1751,13 @@ class Plugin(InSourcePlugin):
             List of target names found in the Makefile.
         """
         try:
-            content = makefile_path.read_text()
+            st = makefile_path.stat()
+            return list(
+                _extract_targets_cached(str(makefile_path), st.st_mtime_ns, st.st_size)
+            )
         except OSError:
             return []
 
-        # Simple regex to match target definitions (excluding assignments like :=)
-        pattern = re.compile(r"^([a-zA-Z_][a-zA-Z0-9_.-]*)\s*:(?!=)", re.MULTILINE)
-        matches = pattern.findall(content)
-
-        # Filter out internal targets (starting with .) and deduplicate
-        targets: list[str] = []
-        seen: set[str] = set()
-        for name in matches:
-            if not name.startswith(".") and name not in seen:
-                targets.append(name)
-                seen.add(name)
-
-        return targets
-
     @classmethod
     def get_cli_commands(cls) -> list[CLICommand]:
         """Return CLI commands this plugin provides.
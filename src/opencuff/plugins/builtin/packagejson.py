@@ -36,6 +36,7 @@ from __future__ import annotations
 
 import asyncio
 import fnmatch
+import functools
 import hashlib
 import json
 import logging
@@ -53,6 +54,7 @@ from opencuff.plugins.base import (
     CLIArgument,
     CLICommand,
     CLIOption,
+    DiscoveryContext,
     DiscoveryResult,
     InSourcePlugin,
     ToolDefinition,
@@ -652,6 +654,36 @@ class ScriptCache:
         return len(self._cache) > 0
 
 
+# =============================================================================
+# Discovery Helpers
+# =============================================================================
+
+
+@functools.lru_cache(maxsize=64)
+def _read_script_names_cached(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Read script names from package.json, memoized on its stat signature.
+
+    The mtime and size are part of the cache key so an edited package.json
+    is re-parsed on the next call.
+
+    Args:
+        path: Path to package.json.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: Size of the file in bytes.
+
+    Returns:
+        Script names in declaration order.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not valid UTF-8 encoded JSON.
+    """
+    # json.loads accepts bytes directly and detects the encoding itself
+    data = json.loads(Path(path).read_bytes())
+    scripts = data.get("scripts", {}) if isinstance(data, dict) else {}
+    return tuple(scripts)
+
+
 # =============================================================================
 # Plugin Implementation
 # =============================================================================
@@ -1116,7 +1148,9 @@ class Plugin(InSourcePlugin):
     # =========================================================================
 
     @classmethod
-    def discover(cls, directory: Path) -> DiscoveryResult:
+    def discover(
+        cls, directory: Path, context: DiscoveryContext | None = None
+    ) -> DiscoveryResult:
         """Discover if this plugin is applicable to the given directory.
 
         Checks for the presence of package.json and extracts script information.
@@ -1124,25 +1158,29 @@ class Plugin(InSourcePlugin):
 
         Args:
             directory: The directory to scan for package.json.
+            context: Optional shared snapshot of directory.
 
         Returns:
             DiscoveryResult indicating applicability and suggested config.
         """
         package_json_path = directory / "package.json"
 
-        if not package_json_path.exists():
+        # Try to parse package.json
+        try:
+            st = package_json_path.stat()
+            script_names = list(
+                _read_script_names_cached(
+                    str(package_json_path), st.st_mtime_ns, st.st_size
+                )
+            )
+        except FileNotFoundError:
             return DiscoveryResult(
                 applicable=False,
                 confidence=0.0,
                 suggested_config={},
                 description="No package.json found",
             )
-
-        # Try to parse package.json
-        try:
-            content = package_json_path.read_text()
-            data = json.loads(content)
-        except json.JSONDecodeError:
+        except ValueError:
             return DiscoveryResult(
                 applicable=False,
                 confidence=0.0,
@@ -1150,12 +1188,8 @@ class Plugin(InSourcePlugin):
                 description="package.json contains invalid JSON",
             )
 
-        # Extract scripts
-        scripts = data.get("scripts", {}) if isinstance(data, dict) else {}
-        script_names = list(scripts.keys())
-
         # Detect package manager
-        package_manager = cls._detect_package_manager_static(directory)
+        package_manager = cls._detect_package_manager_static(directory, context)
 
         # Build description
         script_count = len(script_names)
@@ -1176,9 +1210,6 @@ class Plugin(InSourcePlugin):
             "expose_list_scripts": True,
         }
 
-        # Build warnings list
-        warnings: list[str] = []
-
         # Build tool names as they would appear in the MCP server
         tool_names = [f"{package_manager}_list_scripts"]
         tool_names.extend(f"{package_manager}_{name}" for name in script_names)
@@ -1188,12 +1219,13 @@ class Plugin(InSourcePlugin):
             confidence=1.0,
             suggested_config=suggested_config,
             description=description,
-            warnings=warnings,
-            discovered_items=tool_names,
+            discovered_items=tuple(tool_names),
         )
 
     @staticmethod
-    def _detect_package_manager_static(directory: Path) -> str:
+    def _detect_package_manager_static(
+        directory: Path, context: DiscoveryContext | None = None
+    ) -> str:
         """Detect package manager from lock files (static method for discovery).
 
         Lock file precedence (first match wins):
@@ -1205,18 +1237,25 @@ class Plugin(InSourcePlugin):
 
         Args:
             directory: The directory to check for lock files.
+            context: Optional shared snapshot of directory. When given, lock
+                files are looked up in it instead of stat-ing each one.
 
         Returns:
             The detected package manager name.
         """
-        if (directory / "pnpm-lock.yaml").exists():
-            return "pnpm"
-        if (directory / "yarn.lock").exists():
-            return "yarn"
-        if (directory / "bun.lockb").exists():
-            return "bun"
-        if (directory / "package-lock.json").exists():
-            return "npm"
+        lock_files = (
+            ("pnpm-lock.yaml", "pnpm"),
+            ("yarn.lock", "yarn"),
+            ("bun.lockb", "bun"),
+            ("package-lock.json", "npm"),
+        )
+        for lock_file, package_manager in lock_files:
+            if context is not None:
+                found = context.exists(lock_file)
+            else:
+                found = (directory / lock_file).exists()
+            if found:
+                return package_manager
         return "npm"  # Default
 
     # =========================================================================
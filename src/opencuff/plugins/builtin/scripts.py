@@ -52,6 +52,7 @@ from opencuff.plugins.base import (
     CLIArgument,
     CLICommand,
     CLIOption,
+    DiscoveryContext,
     DiscoveryResult,
     InSourcePlugin,
     ToolDefinition,
@@ -1153,13 +1154,17 @@ class Plugin(InSourcePlugin):
     # =========================================================================
 
     @classmethod
-    def discover(cls, directory: Path) -> DiscoveryResult:
+    def discover(
+        cls, directory: Path, context: DiscoveryContext | None = None
+    ) -> DiscoveryResult:
         """Discover scripts in the directory.
 
         Scans for common script patterns and returns suggested configuration.
 
         Args:
             directory: The directory to scan.
+            context: Optional shared snapshot of directory used to match the
+                script patterns without re-scanning.
 
         Returns:
             DiscoveryResult indicating applicability and suggested config.
@@ -1177,7 +1182,10 @@ class Plugin(InSourcePlugin):
         matched_patterns: list[str] = []
 
         for pattern in script_patterns:
-            matches = list(directory.glob(pattern))
+            if context is not None:
+                matches = context.glob(pattern)
+            else:
+                matches = list(directory.glob(pattern))
             if matches:
                 discovered_scripts.extend(matches)
                 matched_patterns.append(pattern)
@@ -1216,8 +1224,8 @@ class Plugin(InSourcePlugin):
                 "cache_ttl": 300,
             },
             description=f"Found {len(discovered_scripts)} scripts",
-            discovered_items=tool_names,
-            warnings=warnings,
+            discovered_items=tuple(tool_names),
+            warnings=tuple(warnings),
         )
 
     @staticmethod
@@ -14,6 +14,7 @@ Models:
 Functions:
     - expand_env_vars: Expand ${VAR} patterns in strings
     - expand_env_vars_in_dict: Recursively expand env vars in nested dicts
+    - settings_from_dict: Validate settings from an already-parsed document
     - load_settings: Load and validate settings from a YAML file
 """
 
@@ -139,6 +140,9 @@ class OpenCuffSettings(BaseModel):
     plugins: dict[str, PluginConfig] = Field(default_factory=dict)
 
 
+# Prefer the LibYAML C parser when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Environment variable expansion pattern: ${VAR_NAME}
 _ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
 
@@ -201,6 +205,32 @@ def expand_env_vars_in_dict(data: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
+def settings_from_dict(data: dict[str, Any] | None) -> OpenCuffSettings:
+    """Validate settings from an already-parsed YAML document.
+
+    Performs environment variable expansion on all string values before
+    validation.
+
+    Args:
+        data: Parsed settings document, or None for an empty file.
+
+    Returns:
+        Validated OpenCuffSettings instance.
+
+    Raises:
+        pydantic.ValidationError: If the configuration is invalid.
+        ValueError: If environment variable expansion fails.
+    """
+    # Handle empty file
+    if data is None:
+        data = {}
+
+    # Expand environment variables
+    data = expand_env_vars_in_dict(data)
+
+    return OpenCuffSettings.model_validate(data)
+
+
 def load_settings(path: str | Path) -> OpenCuffSettings:
     """Load and validate settings from a YAML file.
 
@@ -230,13 +260,6 @@ def load_settings(path: str | Path) -> OpenCuffSettings:
         raise FileNotFoundError(f"Settings file not found: {path}")
 
     with path.open() as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_SafeLoader)
 
-    # Handle empty file
-    if data is None:
-        data = {}
-
-    # Expand environment variables
-    data = expand_env_vars_in_dict(data)
-
-    return OpenCuffSettings.model_validate(data)
+    return settings_from_dict(data)
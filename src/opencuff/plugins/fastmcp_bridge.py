@@ -211,8 +211,13 @@ class FastMCPBridge:
         tool_wrapper.__name__ = fqn
         tool_wrapper.__doc__ = tool_def.description
 
-        # Build parameters schema - default to empty object if not provided
-        parameters = tool_def.parameters or {"type": "object", "properties": {}}
+        # Build parameters schema - default to empty object if not provided.
+        # FunctionTool needs a plain dict, not any Mapping.
+        parameters = (
+            dict(tool_def.parameters)
+            if tool_def.parameters
+            else {"type": "object", "properties": {}}
+        )
 
         # Create FunctionTool directly to bypass the **kwargs restriction
         # in from_function. FastMCP's FunctionTool.run() validates arguments
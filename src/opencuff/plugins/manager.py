@@ -92,7 +92,7 @@ class PluginLifecycle:
         Raises:
             PluginError: If loading or initialization fails.
         """
-        if self._state != PluginState.UNLOADED:
+        if self._state is not PluginState.UNLOADED:
             raise PluginError(
                 code=PluginErrorCode.LOAD_FAILED,
                 message=f"Cannot load plugin in state {self._state.value}",
@@ -214,7 +214,7 @@ class PluginLifecycle:
             PluginError: If the plugin is not active or call fails.
         """
         async with self._barrier.request_scope():
-            if self._adapter is None or self._state != PluginState.ACTIVE:
+            if self._adapter is None or self._state is not PluginState.ACTIVE:
                 raise PluginError(
                     code=PluginErrorCode.PLUGIN_UNHEALTHY,
                     message="Plugin not active",
@@ -229,7 +229,7 @@ class PluginLifecycle:
         Returns:
             True if healthy, False otherwise.
         """
-        if self._adapter is None or self._state != PluginState.ACTIVE:
+        if self._adapter is None or self._state is not PluginState.ACTIVE:
             return False
 
         try:
@@ -248,7 +248,7 @@ class PluginLifecycle:
         Returns:
             True if recovery succeeded, False otherwise.
         """
-        if self._state != PluginState.ERROR:
+        if self._state is not PluginState.ERROR:
             return True
 
         self._state = PluginState.RECOVERING
@@ -414,7 +414,7 @@ class HealthMonitor:
                 break
 
             for name, lifecycle in self.plugin_manager.plugins.items():
-                if lifecycle.state != PluginState.ACTIVE:
+                if lifecycle.state is not PluginState.ACTIVE:
                     continue
 
                 try:
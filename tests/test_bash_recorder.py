@@ -14,6 +14,8 @@ Tests cover:
 
 from __future__ import annotations
 
+import asyncio
+import gzip
 import json
 from datetime import UTC, datetime
 from pathlib import Path
@@ -43,6 +45,7 @@ class TestBashRecorderConfig:
         assert config.recording.max_output_size == 1_000_000
         assert config.recording.session_mode == "per_conversation"
         assert config.recording.retention_days == 30
+        assert config.recording.compress_on_finalize is False
 
         # Execution defaults
         assert config.execution.default_timeout == 120
@@ -294,12 +297,14 @@ class TestSessionManager:
 
         session_id = manager._generate_session_id()
 
-        # Format: YYYYMMDD_HHMMSS_uuid4_prefix
+        # Format: YYYYMMDD_HHMMSS_<12 random hex digits>
         parts = session_id.split("_")
         assert len(parts) == 3
         assert len(parts[0]) == 8  # YYYYMMDD
         assert len(parts[1]) == 6  # HHMMSS
-        assert len(parts[2]) == 12  # uuid4 prefix (first 12 chars)
+        assert len(parts[2]) == 12  # random hex suffix
+        datetime.strptime(parts[0] + parts[1], "%Y%m%d%H%M%S")
+        int(parts[2], 16)
 
     def test_entry_id_format(self) -> None:
         """Verify entry ID follows expected format."""
@@ -319,6 +324,22 @@ class TestSessionManager:
         assert entry_id.startswith("e_")
         parts = entry_id.split("_")
         assert len(parts) == 4
+        datetime.strptime(parts[1] + parts[2], "%Y%m%d%H%M%S")
+        assert parts[3] == "001"
+
+    def test_entry_id_uses_given_timestamp(self) -> None:
+        """Verify the entry ID is derived from the entry's own timestamp."""
+        from opencuff.plugins.builtin.bash_recorder import (
+            RecordingConfig,
+            SessionManager,
+        )
+
+        config = RecordingConfig(directory=Path("/tmp/recordings"))
+        manager = SessionManager(config)
+        timestamp = datetime(2026, 1, 18, 14, 30, 52, 999_999, tzinfo=UTC)
+
+        assert manager.get_next_entry_id(timestamp) == "e_20260118_143052_001"
+        assert manager.entry_count == 1
 
     @pytest.mark.asyncio
     async def test_start_session(self, tmp_path: Path) -> None:
@@ -475,6 +496,23 @@ class TestRecorder:
         lines = session_file.read_text().strip().split("\n")
         assert len(lines) == 3
 
+    def test_directories_created_on_construction(self, tmp_path: Path) -> None:
+        """Verify the sessions directory exists before anything is written."""
+        from opencuff.plugins.builtin.bash_recorder import (
+            Recorder,
+            RecordingConfig,
+            SessionManager,
+        )
+
+        recordings_dir = tmp_path / "recordings"
+        config = RecordingConfig(directory=recordings_dir)
+
+        Recorder(session_manager=SessionManager(config), config=config)
+
+        sessions_dir = recordings_dir / "sessions"
+        assert sessions_dir.is_dir()
+        assert sessions_dir.stat().st_mode & 0o777 == 0o700
+
     @pytest.mark.asyncio
     async def test_directory_permissions(self, tmp_path: Path) -> None:
         """Verify directories are created with restrictive permissions."""
@@ -514,6 +552,214 @@ class TestRecorder:
         dir_mode = sessions_dir.stat().st_mode & 0o777
         assert dir_mode == 0o700
 
+    @pytest.mark.asyncio
+    async def test_session_paths_follow_session_changes(self, tmp_path: Path) -> None:
+        """Verify cached file paths are reused and refreshed on a new session."""
+        from opencuff.plugins.builtin.bash_recorder import (
+            Recorder,
+            RecordingConfig,
+            SessionManager,
+        )
+
+        config = RecordingConfig(directory=tmp_path / "recordings")
+        session_manager = SessionManager(config)
+        recorder = Recorder(session_manager=session_manager, config=config)
+
+        first_id = await session_manager.start_session()
+        first_path = recorder._get_session_file_path()
+        assert recorder._get_session_file_path() is first_path
+        assert first_path.name == f"{first_id}.jsonl"
+        assert recorder._get_metadata_file_path().name == f"{first_id}.meta.json"
+
+        await session_manager.finalize_session(status="complete")
+        second_id = await session_manager.start_session()
+        second_path = recorder._get_session_file_path()
+        assert second_path.name == f"{second_id}.jsonl"
+        assert second_path.parent == first_path.parent
+
+    @pytest.mark.asyncio
+    async def test_metadata_write_is_atomic(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify metadata replaces the old file whole or not at all."""
+        from opencuff.plugins.builtin import bash_recorder
+        from opencuff.plugins.builtin.bash_recorder import (
+            Recorder,
+            RecordingConfig,
+            SessionManager,
+        )
+
+        config = RecordingConfig(directory=tmp_path / "recordings")
+        session_manager = SessionManager(config)
+        await session_manager.start_session()
+        recorder = Recorder(session_manager=session_manager, config=config)
+
+        metadata = await session_manager.finalize_session(status="complete")
+        assert metadata is not None
+        await recorder.write_session_metadata(metadata)
+
+        meta_file = recorder._get_paths_for_session(metadata.session_id)[1]
+        assert json.loads(meta_file.read_text())["status"] == "complete"
+        assert meta_file.stat().st_mode & 0o777 == 0o600
+
+        def failing_replace(src: object, dst: object) -> None:
+            raise OSError("rename failed")
+
+        monkeypatch.setattr(bash_recorder.os, "replace", failing_replace)
+        await recorder.write_session_metadata(
+            metadata.model_copy(update={"status": "interrupted"})
+        )
+
+        # The previous metadata survives and no temporary file is left behind
+        assert json.loads(meta_file.read_text())["status"] == "complete"
+        assert sorted(p.name for p in meta_file.parent.iterdir()) == [meta_file.name]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_are_batched(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify concurrent entries share batches and keep their order."""
+        from opencuff.plugins.builtin.bash_recorder import (
+            Recorder,
+            RecordingConfig,
+            RecordingEntry,
+            SessionManager,
+        )
+
+        config = RecordingConfig(directory=tmp_path / "recordings")
+        session_manager = SessionManager(config)
+        await session_manager.start_session()
+        recorder = Recorder(session_manager=session_manager, config=config)
+
+        batch_sizes: list[int] = []
+        original = recorder._write_batch_sync
+
+        def tracking_write(batch: list[tuple[Path, bytes]]) -> None:
+            batch_sizes.append(len(batch))
+            original(batch)
+
+        monkeypatch.setattr(recorder, "_write_batch_sync", tracking_write)
+
+        entries = [
+            RecordingEntry(
+                entry_id=f"e_{i:03d}",
+                session_id=session_manager.current_session_id,
+                sequence_number=i + 1,
+                timestamp=datetime.now(UTC),
+                duration_ms=100,
+                command=f"echo {i}",
+                working_directory="/tmp",
+                shell="/bin/bash",
+                timeout_seconds=60,
+                timed_out=False,
+                output_truncated=False,
+                opencuff_version="0.1.0",
+                plugin_version="1.0.0",
+            )
+            for i in range(10)
+        ]
+        await asyncio.gather(*(recorder.write_entry(entry) for entry in entries))
+        await recorder.close()
+
+        session_file = (
+            tmp_path
+            / "recordings"
+            / "sessions"
+            / f"{session_manager.current_session_id}.jsonl"
+        )
+        lines = session_file.read_text().strip().split("\n")
+        assert [json.loads(line)["command"] for line in lines] == [
+            f"echo {i}" for i in range(10)
+        ]
+        assert sum(batch_sizes) == 10
+        assert len(batch_sizes) < 10
+        assert session_file.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.asyncio
+    async def test_write_after_close_reopens_file(self, tmp_path: Path) -> None:
+        """Verify a closed recorder reopens the session file on the next write."""
+        from opencuff.plugins.builtin.bash_recorder import (
+            Recorder,
+            RecordingConfig,
+            RecordingEntry,
+            SessionManager,
+        )
+
+        config = RecordingConfig(directory=tmp_path / "recordings")
+        session_manager = SessionManager(config)
+        await session_manager.start_session()
+        recorder = Recorder(session_manager=session_manager, config=config)
+
+        for i in range(2):
+            entry = RecordingEntry(
+                entry_id=f"e_{i:03d}",
+                session_id=session_manager.current_session_id,
+                sequence_number=i + 1,
+                timestamp=datetime.now(UTC),
+                duration_ms=100,
+                command=f"echo {i}",
+                working_directory="/tmp",
+                shell="/bin/bash",
+                timeout_seconds=60,
+                timed_out=False,
+                output_truncated=False,
+                opencuff_version="0.1.0",
+                plugin_version="1.0.0",
+            )
+            await recorder.write_entry(entry)
+            await recorder.close()
+            assert recorder._fd is None
+
+        session_file = (
+            tmp_path
+            / "recordings"
+            / "sessions"
+            / f"{session_manager.current_session_id}.jsonl"
+        )
+        assert len(session_file.read_text().strip().split("\n")) == 2
+
+    @pytest.mark.asyncio
+    async def test_write_failure_raises_recording_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify an I/O error while writing surfaces as RecordingError."""
+        from opencuff.plugins.builtin.bash_recorder import (
+            Recorder,
+            RecordingConfig,
+            RecordingEntry,
+            RecordingError,
+            SessionManager,
+        )
+
+        config = RecordingConfig(directory=tmp_path / "recordings")
+        session_manager = SessionManager(config)
+        await session_manager.start_session()
+        recorder = Recorder(session_manager=session_manager, config=config)
+
+        def failing_write(batch: list[tuple[Path, bytes]]) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(recorder, "_write_batch_sync", failing_write)
+
+        entry = RecordingEntry(
+            entry_id="e_001",
+            session_id=session_manager.current_session_id,
+            sequence_number=1,
+            timestamp=datetime.now(UTC),
+            duration_ms=100,
+            command="echo test",
+            working_directory="/tmp",
+            shell="/bin/bash",
+            timeout_seconds=60,
+            timed_out=False,
+            output_truncated=False,
+            opencuff_version="0.1.0",
+            plugin_version="1.0.0",
+        )
+
+        with pytest.raises(RecordingError, match="disk full"):
+            await recorder.write_entry(entry)
+
 
 # =============================================================================
 # TestCommandExecution
@@ -649,6 +895,31 @@ class TestCommandExecution:
 
         await plugin.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_execute_rejects_file_as_working_directory(
+        self, tmp_path: Path
+    ) -> None:
+        """Verify a working directory that is a file is rejected."""
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        config = {
+            "recording": {"directory": str(tmp_path / "recordings")},
+        }
+        plugin = Plugin(config)
+        await plugin.initialize()
+        not_a_dir = tmp_path / "file.txt"
+        not_a_dir.write_text("")
+
+        result = await plugin.call_tool(
+            "execute",
+            {"command": "pwd", "working_directory": str(not_a_dir)},
+        )
+
+        assert result.success is False
+        assert "not a directory" in result.error
+
+        await plugin.shutdown()
+
     @pytest.mark.asyncio
     async def test_execute_respects_max_timeout(self, tmp_path: Path) -> None:
         """Verify requested timeout is capped at max_timeout."""
@@ -671,6 +942,64 @@ class TestCommandExecution:
 
         await plugin.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_duration_ignores_wall_clock_steps(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify a wall clock stepping backwards does not skew durations."""
+        import time
+
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        config = {
+            "recording": {"directory": str(tmp_path / "recordings")},
+        }
+        plugin = Plugin(config)
+        await plugin.initialize()
+
+        wall_clock = iter(range(10_000, 0, -1))
+        monkeypatch.setattr(time, "time", lambda: float(next(wall_clock)))
+        await plugin.call_tool("execute", {"command": "sleep 0.05"})
+        monkeypatch.undo()
+        await plugin.shutdown()
+
+        sessions_dir = tmp_path / "recordings" / "sessions"
+        entry = json.loads(next(sessions_dir.glob("*.jsonl")).read_text())
+
+        assert 50 <= entry["duration_ms"] < 10_000
+
+    @pytest.mark.asyncio
+    async def test_env_overrides_survive_config_reload(self, tmp_path: Path) -> None:
+        """Verify commands see the overrides from the current config."""
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        config = {
+            "recording": {"directory": str(tmp_path / "recordings")},
+            "execution": {"env_overrides": {"CUFF_TEST_VAR": "first"}},
+        }
+        plugin = Plugin(config)
+        await plugin.initialize()
+
+        result = await plugin.call_tool("execute", {"command": "echo $CUFF_TEST_VAR"})
+        assert result.data["stdout"].strip() == "first"
+        assert "PATH" in plugin._build_env()
+
+        await plugin.on_config_reload(
+            {
+                **config,
+                "execution": {
+                    "inherit_env": False,
+                    "env_overrides": {"CUFF_TEST_VAR": "second"},
+                },
+            }
+        )
+
+        result = await plugin.call_tool("execute", {"command": "echo $CUFF_TEST_VAR"})
+        assert result.data["stdout"].strip() == "second"
+        assert plugin._build_env() == {"CUFF_TEST_VAR": "second"}
+
+        await plugin.shutdown()
+
 
 # =============================================================================
 # TestBashRecorderPlugin
@@ -760,6 +1089,70 @@ class TestBashRecorderPlugin:
 
         await plugin.shutdown()
 
+    @pytest.mark.parametrize("chunk_size", [7, 64, 32 * 1024])
+    def test_read_recent_entries_from_tail(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, chunk_size: int
+    ) -> None:
+        """Verify the newest entries are returned across block boundaries."""
+        from opencuff.plugins.builtin import bash_recorder
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        monkeypatch.setattr(bash_recorder, "_TAIL_CHUNK_SIZE", chunk_size)
+        session_file = tmp_path / "session.jsonl"
+        lines = [
+            json.dumps({"entry_id": f"e_{i}", "command": "x" * i}) for i in range(20)
+        ]
+        # A malformed line and a blank line in the middle are skipped
+        lines[15:15] = ["{not json", ""]
+        session_file.write_text("\n".join(lines) + "\n")
+        plugin = Plugin({})
+
+        recent = plugin._read_recent_entries(session_file, 8)
+        everything = plugin._read_recent_entries(session_file, 100)
+
+        assert [e["entry_id"] for e in recent] == [f"e_{i}" for i in range(12, 20)]
+        assert [e["entry_id"] for e in everything] == [f"e_{i}" for i in range(20)]
+
+    @pytest.mark.parametrize("chunk_size", [7, 4096, 32 * 1024])
+    def test_read_recent_entries_with_lines_longer_than_a_block(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, chunk_size: int
+    ) -> None:
+        """Verify entries spanning many blocks are reassembled intact."""
+        from opencuff.plugins.builtin import bash_recorder
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        monkeypatch.setattr(bash_recorder, "_TAIL_CHUNK_SIZE", chunk_size)
+        big = "y" * 200_000
+        lines = [
+            json.dumps({"entry_id": "e_0", "command": "small"}),
+            json.dumps({"entry_id": "e_1", "command": big}),
+            json.dumps({"entry_id": "e_2", "command": big + "z"}),
+        ]
+        session_file = tmp_path / "session.jsonl"
+        session_file.write_text("\n".join(lines) + "\n")
+
+        recent = Plugin({})._read_recent_entries(session_file, 2)
+        everything = Plugin({})._read_recent_entries(session_file, 10)
+
+        assert [e["entry_id"] for e in recent] == ["e_1", "e_2"]
+        assert recent[1]["command"] == big + "z"
+        assert [e["entry_id"] for e in everything] == ["e_0", "e_1", "e_2"]
+
+    def test_read_recent_entries_without_orjson(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify the standard library parser is used when orjson is missing."""
+        from opencuff.plugins.builtin import bash_recorder
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        monkeypatch.setattr(bash_recorder, "_json_loads", json.loads)
+        session_file = tmp_path / "session.jsonl"
+        session_file.write_text('{"entry_id": "e_1"}\n{truncated\n')
+
+        recent = Plugin({})._read_recent_entries(session_file, 10)
+
+        assert [e["entry_id"] for e in recent] == ["e_1"]
+
     @pytest.mark.asyncio
     async def test_unknown_tool_returns_error(self, tmp_path: Path) -> None:
         """Verify unknown tool returns error."""
@@ -795,6 +1188,87 @@ class TestBashRecorderPlugin:
 
         await plugin.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_unchanged_config_reload_is_a_no_op(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify reloading an equal config skips validation."""
+        from opencuff.plugins.builtin import bash_recorder
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        config = {
+            "recording": {"directory": str(tmp_path / "recordings")},
+        }
+        plugin = Plugin(config)
+        await plugin.initialize()
+        plugin_config = plugin._plugin_config
+
+        def fail_validate(*args: object, **kwargs: object) -> None:
+            raise AssertionError("config was revalidated")
+
+        monkeypatch.setattr(
+            bash_recorder.BashRecorderConfig, "model_validate", fail_validate
+        )
+        await plugin.on_config_reload(
+            {"recording": {"directory": str(tmp_path / "recordings")}}
+        )
+
+        assert plugin._plugin_config is plugin_config
+
+        await plugin.shutdown()
+
+    def test_disk_space_check_reuses_usage_probe(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify free space is read once per TTL and compared per call."""
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        plugin = Plugin({"recording": {"directory": str(tmp_path / "recordings")}})
+        probes: list[bool] = []
+
+        def fake_probe() -> int:
+            probes.append(True)
+            return 1_000
+
+        monkeypatch.setattr(plugin, "_probe_disk_free", fake_probe)
+
+        assert plugin._check_disk_space(min_bytes=500) is True
+        assert plugin._check_disk_space(min_bytes=5_000) is False
+        assert len(probes) == 1
+
+    @pytest.mark.asyncio
+    async def test_health_check_reuses_writability_probe(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify the directory is probed at most once per TTL."""
+        from opencuff.plugins.builtin import bash_recorder
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        config = {
+            "recording": {"directory": str(tmp_path / "recordings")},
+        }
+        plugin = Plugin(config)
+        await plugin.initialize()
+
+        probes: list[bool] = []
+        original_probe = plugin._probe_directory_writable
+
+        def counting_probe() -> bool:
+            probes.append(True)
+            return original_probe()
+
+        monkeypatch.setattr(plugin, "_probe_directory_writable", counting_probe)
+
+        assert await plugin.health_check() is True
+        assert await plugin.health_check() is True
+        assert len(probes) == 1
+
+        monkeypatch.setattr(bash_recorder, "_HEALTH_PROBE_TTL", 0.0)
+        assert await plugin.health_check() is True
+        assert len(probes) == 2
+
+        await plugin.shutdown()
+
     @pytest.mark.asyncio
     async def test_shutdown_finalizes_session(self, tmp_path: Path) -> None:
         """Verify shutdown finalizes the recording session."""
@@ -816,6 +1290,57 @@ class TestBashRecorderPlugin:
         meta_files = list(sessions_dir.glob("*.meta.json"))
         assert len(meta_files) >= 1
 
+    @pytest.mark.asyncio
+    async def test_shutdown_compresses_session_when_configured(
+        self, tmp_path: Path
+    ) -> None:
+        """Verify compress_on_finalize replaces the JSONL file with a gzip copy."""
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        config = {
+            "recording": {
+                "directory": str(tmp_path / "recordings"),
+                "compress_on_finalize": True,
+            },
+        }
+        plugin = Plugin(config)
+        await plugin.initialize()
+
+        await plugin.call_tool("execute", {"command": "echo one"})
+        await plugin.call_tool("execute", {"command": "echo two"})
+        await plugin.shutdown()
+
+        sessions_dir = tmp_path / "recordings" / "sessions"
+        assert list(sessions_dir.glob("*.jsonl")) == []
+        assert list(sessions_dir.glob("*.tmp")) == []
+
+        (gz_file,) = sessions_dir.glob("*.jsonl.gz")
+        assert gz_file.stat().st_mode & 0o777 == 0o600
+        with gzip.open(gz_file, "rt") as f:
+            commands = [json.loads(line)["command"] for line in f]
+        assert commands == ["echo one", "echo two"]
+
+    @pytest.mark.asyncio
+    async def test_disabling_recording_compresses_session(self, tmp_path: Path) -> None:
+        """Verify a session finalized by a reload is compressed as well."""
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        recording = {
+            "directory": str(tmp_path / "recordings"),
+            "compress_on_finalize": True,
+        }
+        plugin = Plugin({"recording": recording})
+        await plugin.initialize()
+        await plugin.call_tool("execute", {"command": "echo one"})
+
+        await plugin.on_config_reload({"recording": {**recording, "enabled": False}})
+
+        sessions_dir = tmp_path / "recordings" / "sessions"
+        assert list(sessions_dir.glob("*.jsonl")) == []
+        assert len(list(sessions_dir.glob("*.jsonl.gz"))) == 1
+
+        await plugin.shutdown()
+
 
 # =============================================================================
 # TestGracefulDegradation
@@ -949,6 +1474,65 @@ class TestOutputTruncation:
 
         await plugin.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_no_truncation_recorded_without_capture(self, tmp_path: Path) -> None:
+        """Verify output is neither recorded nor measured when capture is off."""
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        config = {
+            "recording": {
+                "directory": str(tmp_path / "recordings"),
+                "capture_output": False,
+                "max_output_size": 50,
+            },
+        }
+        plugin = Plugin(config)
+        await plugin.initialize()
+
+        result = await plugin.call_tool(
+            "execute",
+            {"command": "python3 -c \"print('x' * 500)\""},
+        )
+        await plugin.shutdown()
+
+        sessions_dir = tmp_path / "recordings" / "sessions"
+        entry = json.loads(next(sessions_dir.glob("*.jsonl")).read_text())
+
+        assert len(result.data["stdout"]) > 500
+        assert entry["stdout"] is None
+        assert entry["stderr"] is None
+        assert entry["output_truncated"] is False
+        assert entry["output_truncated_bytes"] is None
+
+    @pytest.mark.asyncio
+    async def test_truncation_limit_counts_utf8_bytes(self, tmp_path: Path) -> None:
+        """Verify the limit applies to encoded bytes, not characters."""
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        config = {
+            "recording": {
+                "directory": str(tmp_path / "recordings"),
+                "max_output_size": 11,
+            },
+        }
+        plugin = Plugin(config)
+        await plugin.initialize()
+
+        # Ten two-byte characters plus the newline: 21 bytes, 11 characters
+        await plugin.call_tool(
+            "execute",
+            {"command": "python3 -c \"print('\\u00e9' * 10)\""},
+        )
+        await plugin.shutdown()
+
+        sessions_dir = tmp_path / "recordings" / "sessions"
+        entry = json.loads(next(sessions_dir.glob("*.jsonl")).read_text())
+
+        assert entry["output_truncated"] is True
+        assert entry["output_truncated_bytes"] == 21
+        # The cut lands inside the sixth character, which becomes U+FFFD
+        assert entry["stdout"] == "\u00e9" * 5 + "\ufffd"
+
 
 # =============================================================================
 # TestEnvironmentCapture
@@ -1014,6 +1598,33 @@ class TestEnvironmentCapture:
 
         await plugin.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_unset_allowlisted_vars_are_omitted(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify only allowlisted variables that are set are captured."""
+        from opencuff.plugins.builtin.bash_recorder import Plugin
+
+        monkeypatch.setenv("CUFF_SET_VAR", "present")
+        monkeypatch.delenv("CUFF_UNSET_VAR", raising=False)
+        config = {
+            "recording": {
+                "directory": str(tmp_path / "recordings"),
+                "capture_env": True,
+                "env_allowlist": ["CUFF_SET_VAR", "CUFF_UNSET_VAR"],
+            },
+        }
+        plugin = Plugin(config)
+        await plugin.initialize()
+
+        await plugin.call_tool("execute", {"command": "true"})
+        await plugin.shutdown()
+
+        sessions_dir = tmp_path / "recordings" / "sessions"
+        entry = json.loads(next(sessions_dir.glob("*.jsonl")).read_text())
+
+        assert entry["environment"] == {"CUFF_SET_VAR": "present"}
+
 
 # =============================================================================
 # TestBashRecorderIntegration
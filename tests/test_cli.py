@@ -101,6 +101,46 @@ class TestDiscoveryCoordinator:
         assert "test_plugin" in results
         assert results["test_plugin"].applicable is False
 
+    def test_discover_all_passes_shared_context(self, tmp_path: Path) -> None:
+        """Verify plugins accepting a context share one directory snapshot."""
+        from opencuff.cli.discovery import DiscoveryCoordinator
+        from opencuff.plugins.base import DiscoveryContext
+
+        (tmp_path / "Makefile").touch()
+        seen: list[DiscoveryContext | None] = []
+
+        class ContextPlugin(InSourcePlugin):
+            @classmethod
+            def discover(
+                cls, directory: Path, context: DiscoveryContext | None = None
+            ) -> DiscoveryResult:
+                seen.append(context)
+                return DiscoveryResult(
+                    applicable=context is not None and context.exists("Makefile"),
+                    confidence=1.0,
+                    suggested_config={},
+                    description="Context plugin",
+                )
+
+            def get_tools(self) -> list[ToolDefinition]:
+                return []
+
+            async def call_tool(
+                self, tool_name: str, arguments: dict[str, Any]
+            ) -> ToolResult:
+                return ToolResult(success=True)
+
+        coordinator = DiscoveryCoordinator(
+            plugins={"first": ContextPlugin, "second": ContextPlugin},
+            module_paths={},
+        )
+        results = coordinator.discover_all(tmp_path)
+
+        assert results["first"].applicable
+        assert len(seen) == 2
+        assert seen[0] is not None
+        assert seen[0] is seen[1]
+
     def test_discover_all_raises_on_nonexistent_directory(self) -> None:
         """Verify discover_all raises error for non-existent directory."""
         from opencuff.cli.discovery import DiscoveryCoordinator
@@ -161,6 +201,55 @@ class TestDiscoveryCoordinator:
         assert settings["plugins"]["test_plugin"]["module"] == "test.module.path"
         assert settings["plugins"]["test_plugin"]["config"]["option"] == "value"
 
+    def test_generate_settings_defaults_to_builtin_module(self, tmp_path: Path) -> None:
+        """Verify plugins without a module path use the builtin module path."""
+        from opencuff.cli.discovery import DiscoveryCoordinator
+
+        class ApplicablePlugin(InSourcePlugin):
+            @classmethod
+            def discover(cls, directory: Path) -> DiscoveryResult:
+                return DiscoveryResult(
+                    applicable=True,
+                    confidence=1.0,
+                    suggested_config={},
+                    description="Found",
+                )
+
+            def get_tools(self) -> list[ToolDefinition]:
+                return []
+
+            async def call_tool(
+                self, tool_name: str, arguments: dict[str, Any]
+            ) -> ToolResult:
+                return ToolResult(success=True)
+
+        coordinator = DiscoveryCoordinator(
+            plugins={"custom": ApplicablePlugin}, module_paths={}
+        )
+
+        settings = coordinator.generate_settings(tmp_path)
+
+        module = settings["plugins"]["custom"]["module"]
+        assert module == "opencuff.plugins.builtin.custom"
+
+    def test_generate_settings_returns_independent_plugin_settings(
+        self, tmp_path: Path
+    ) -> None:
+        """Verify mutating generated plugin_settings doesn't leak into later calls."""
+        from opencuff.cli.discovery import DiscoveryCoordinator
+
+        coordinator = DiscoveryCoordinator(plugins={}, module_paths={})
+
+        first = coordinator.generate_settings(tmp_path)
+        first["plugin_settings"]["live_reload"] = False
+        second = coordinator.generate_settings(tmp_path)
+
+        assert second["plugin_settings"] == {
+            "health_check_interval": 30,
+            "live_reload": True,
+            "default_timeout": 30,
+        }
+
     def test_generate_settings_respects_include_filter(self, tmp_path: Path) -> None:
         """Verify generate_settings respects include filter."""
         from opencuff.cli.discovery import DiscoveryCoordinator
@@ -456,6 +545,42 @@ class TestStatusCommand:
         data = json.loads(result.output)
         assert "plugins" in data or "status" in data
 
+    def test_status_json_verbose_handles_non_string_keys(self, tmp_path: Path) -> None:
+        """Verify status --json -v serializes YAML configs with int keys."""
+        from opencuff.cli.main import app
+
+        runner = CliRunner()
+
+        settings_path = tmp_path / "settings.yml"
+        settings_content = {
+            "version": "1",
+            "plugins": {
+                "makefile": {
+                    "enabled": True,
+                    "type": "in_source",
+                    "module": "opencuff.plugins.builtin.makefile",
+                    "config": {
+                        "makefile_path": "./Makefile",
+                        "extra": {1: "caf\u00e9"},
+                    },
+                }
+            },
+        }
+        settings_path.write_text(yaml.dump(settings_content))
+        (tmp_path / "Makefile").write_text("build:\n\techo build\n")
+
+        result = runner.invoke(
+            app,
+            ["status", "--config", str(settings_path), "--json", "-v"],
+            catch_exceptions=False,
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["plugins"][0]["config"]["extra"] == {"1": "caf\u00e9"}
+        # Non-ASCII text is escaped, as json.dumps does by default
+        assert "\\u00e9" in result.output
+
     def test_status_fails_without_config(self, tmp_path: Path) -> None:
         """Verify status fails gracefully when config not found."""
         from opencuff.cli.main import app
@@ -578,6 +703,149 @@ class TestDoctorCommand:
         # Should mention settings file check
         assert "settings" in result.output.lower() or "yaml" in result.output.lower()
 
+    def test_doctor_resolves_nested_referenced_files(self, tmp_path: Path) -> None:
+        """Verify doctor finds referenced files in plain and nested paths."""
+        from opencuff.cli.main import app
+
+        runner = CliRunner()
+
+        settings_path = tmp_path / "settings.yml"
+        settings_content = {
+            "version": "1",
+            "plugins": {
+                "makefile": {
+                    "enabled": True,
+                    "type": "in_source",
+                    "module": "opencuff.plugins.builtin.makefile",
+                    "config": {"makefile_path": "./Makefile"},
+                },
+                "packagejson": {
+                    "enabled": True,
+                    "type": "in_source",
+                    "module": "opencuff.plugins.builtin.packagejson",
+                    "config": {"package_json_path": "./web/package.json"},
+                },
+            },
+        }
+        settings_path.write_text(yaml.dump(settings_content))
+        (tmp_path / "Makefile").write_text("build:\n\techo build\n")
+        (tmp_path / "web").mkdir()
+        (tmp_path / "web" / "package.json").write_text("{}")
+
+        result = runner.invoke(
+            app, ["doctor", "--config", str(settings_path)], catch_exceptions=False
+        )
+
+        assert result.exit_code == 0
+        assert "File exists: ./Makefile" in result.output
+        assert "File exists: ./web/package.json" in result.output
+
+    def test_doctor_reports_dangling_symlink_as_missing(self, tmp_path: Path) -> None:
+        """Verify a referenced file that is a broken symlink fails the check."""
+        from opencuff.cli.main import app
+
+        settings_path = tmp_path / "settings.yml"
+        settings_content = {
+            "version": "1",
+            "plugins": {
+                "makefile": {
+                    "enabled": True,
+                    "type": "in_source",
+                    "module": "opencuff.plugins.builtin.makefile",
+                    "config": {"makefile_path": "./Makefile"},
+                },
+            },
+        }
+        settings_path.write_text(yaml.dump(settings_content))
+        (tmp_path / "Makefile").symlink_to(tmp_path / "missing.mk")
+
+        result = CliRunner().invoke(
+            app, ["doctor", "--config", str(settings_path)], catch_exceptions=False
+        )
+
+        assert "File not found: ./Makefile" in result.output
+
+        # Once the target exists, the symlinked file passes
+        (tmp_path / "missing.mk").write_text("build:\n\techo build\n")
+        result = CliRunner().invoke(
+            app, ["doctor", "--config", str(settings_path)], catch_exceptions=False
+        )
+
+        assert "File exists: ./Makefile" in result.output
+
+    def test_referenced_file_lookup_falls_back_on_listing_miss(
+        self, tmp_path: Path
+    ) -> None:
+        """Verify a name missing from the listing is still checked on disk.
+
+        On case-insensitive filesystems "makefile" opens a file listed as
+        "Makefile", so a listing miss alone must not count as missing.
+        """
+        from opencuff.cli.commands.doctor import _referenced_file_exists
+
+        (tmp_path / "makefile").write_text("build:\n")
+        listing_with_other_case = {"Makefile"}
+
+        assert _referenced_file_exists(
+            str(tmp_path), "makefile", listing_with_other_case
+        )
+        assert not _referenced_file_exists(
+            str(tmp_path), "GNUmakefile", listing_with_other_case
+        )
+
+    def test_doctor_reports_missing_plugin_module(self, tmp_path: Path) -> None:
+        """Verify doctor fails when a plugin module cannot be found."""
+        from opencuff.cli.main import app
+
+        runner = CliRunner()
+
+        settings_path = tmp_path / "settings.yml"
+        settings_content = {
+            "version": "1",
+            "plugins": {
+                "custom": {
+                    "enabled": True,
+                    "type": "in_source",
+                    "module": "opencuff_nonexistent_module.plugin",
+                }
+            },
+        }
+        settings_path.write_text(yaml.dump(settings_content))
+
+        result = runner.invoke(
+            app, ["doctor", "--config", str(settings_path)], catch_exceptions=False
+        )
+
+        assert result.exit_code == 1
+        assert "[FAIL] Module custom" in result.output
+
+
+class TestVersionCommand:
+    """Tests for the version command."""
+
+    def test_version_matches_pyproject(self) -> None:
+        """Verify the hardcoded version matches the package metadata source."""
+        import tomllib
+
+        from opencuff._version import __version__
+
+        pyproject = Path(__file__).parent.parent / "pyproject.toml"
+        with pyproject.open("rb") as f:
+            project_version = tomllib.load(f)["project"]["version"]
+
+        assert __version__ == project_version
+
+    def test_version_prints_version(self) -> None:
+        """Verify version command prints the package version."""
+        from opencuff._version import __version__
+        from opencuff.cli.main import app
+
+        runner = CliRunner()
+        result = runner.invoke(app, ["version"], catch_exceptions=False)
+
+        assert result.exit_code == 0
+        assert result.output.strip() == f"opencuff {__version__}"
+
 
 class TestCLIAppStructure:
     """Tests for CLI app structure and command registration."""
@@ -625,6 +893,96 @@ class TestCLIAppStructure:
         # Should show help (no_args_is_help=True)
         assert "Usage" in result.output or "Commands" in result.output
 
+    def test_app_help_lists_plugin_commands(self) -> None:
+        """Verify plugin command groups appear in the top-level help."""
+        from opencuff.cli.main import app
+
+        runner = CliRunner()
+        result = runner.invoke(app, ["--help"])
+
+        assert "makefile" in result.output
+
+    def test_plugin_command_detection_accepts_any_override(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify staticmethod and inherited overrides of get_cli_commands count."""
+        from opencuff.cli import main
+        from opencuff.plugins import discovery_registry
+        from opencuff.plugins.base import InSourcePlugin
+
+        class NoCommands(InSourcePlugin):
+            pass
+
+        class ClassMethodCommands(InSourcePlugin):
+            @classmethod
+            def get_cli_commands(cls) -> list:
+                return []
+
+        class StaticCommands(InSourcePlugin):
+            @staticmethod
+            def get_cli_commands() -> list:
+                return []
+
+        class InheritedCommands(StaticCommands):
+            pass
+
+        plugins = {
+            "none": NoCommands,
+            "classmethod": ClassMethodCommands,
+            "static": StaticCommands,
+            "inherited": InheritedCommands,
+        }
+        monkeypatch.setattr(
+            discovery_registry, "get_discoverable_plugins", lambda: plugins
+        )
+
+        group = main.LazyPluginGroup()
+
+        assert set(group._get_plugin_classes()) == {
+            "classmethod",
+            "static",
+            "inherited",
+        }
+
+    def test_core_command_does_not_load_plugin_registry(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify core commands resolve without touching the plugin registry."""
+        from opencuff.cli import main
+        from opencuff.plugins import discovery_registry
+
+        def fail() -> dict:
+            raise AssertionError("plugin registry should not be loaded")
+
+        monkeypatch.setattr(discovery_registry, "get_discoverable_plugins", fail)
+
+        runner = CliRunner()
+        result = runner.invoke(main.app, ["version"])
+
+        assert result.exit_code == 0
+
+    def test_plugin_command_builds_only_requested_plugin(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify invoking one plugin's commands doesn't build the others."""
+        from opencuff.cli import main
+
+        built: list[str] = []
+        original = main._build_plugin_app
+
+        def tracking_build(name: str, plugin_cls: Any) -> Any:
+            built.append(name)
+            return original(name, plugin_cls)
+
+        monkeypatch.setattr(main, "_build_plugin_app", tracking_build)
+
+        runner = CliRunner()
+        result = runner.invoke(main.app, ["makefile", "--help"])
+
+        assert result.exit_code == 0
+        assert "list-targets" in result.output
+        assert built == ["makefile"]
+
 
 class TestInitCommandExitCodes:
     """Tests for init command exit codes."""
@@ -674,3 +1032,217 @@ class TestInitCommandExitCodes:
         )
 
         assert result.exit_code == 2
+
+
+class TestYamlCache:
+    """Tests for the settings YAML parse cache."""
+
+    def test_load_yaml_cached_writes_and_reuses_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify a second load is served from the JSON sidecar."""
+        from opencuff.cli import _yaml_cache
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        settings_path = tmp_path / "settings.yml"
+        settings_path.write_text("version: '1'\nplugins: {}\n")
+
+        assert _yaml_cache.load_yaml_cached(settings_path) == {
+            "version": "1",
+            "plugins": {},
+        }
+        assert _yaml_cache._cache_path_for(settings_path).exists()
+
+        def fail_load(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("YAML should not be re-parsed")
+
+        monkeypatch.setattr(yaml, "load", fail_load)
+        assert _yaml_cache.load_yaml_cached(settings_path)["version"] == "1"
+
+    def test_load_yaml_cached_invalidates_on_change(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify the cache is ignored after the file changes."""
+        from opencuff.cli._yaml_cache import load_yaml_cached
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        settings_path = tmp_path / "settings.yml"
+        settings_path.write_text("version: '1'\n")
+        assert load_yaml_cached(settings_path) == {"version": "1"}
+
+        settings_path.write_text("version: '2'\nextra: true\n")
+        assert load_yaml_cached(settings_path) == {"version": "2", "extra": True}
+
+    def test_load_yaml_cached_empty_file_returns_empty_dict(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify an empty YAML file yields an empty dict."""
+        from opencuff.cli._yaml_cache import load_yaml_cached
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        settings_path = tmp_path / "settings.yml"
+        settings_path.write_text("")
+
+        assert load_yaml_cached(settings_path) == {}
+
+    def test_load_yaml_cached_respects_no_cache_env(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify OPENCUFF_NO_CACHE bypasses the cache directory entirely."""
+        from opencuff.cli import _yaml_cache
+
+        monkeypatch.setenv("OPENCUFF_NO_CACHE", "1")
+        settings_path = tmp_path / "settings.yml"
+        settings_path.write_text("version: '1'\n")
+
+        assert _yaml_cache.load_yaml_cached(settings_path) == {"version": "1"}
+        assert not (tmp_path / "cache").exists()
+
+
+class TestDiscoveryCache:
+    """Tests for the persistent discovery result cache."""
+
+    def test_init_reuses_cached_discovery(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify a repeated init on an unchanged project skips discovery."""
+        from opencuff.cli.discovery import DiscoveryCoordinator
+        from opencuff.cli.main import app
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "Makefile").write_text("build:\n\techo build\n")
+        output_path = project / "settings.yml"
+
+        runner = CliRunner()
+        result = runner.invoke(app, ["init", "--output", str(output_path), "--dry-run"])
+        assert result.exit_code == 0
+
+        def fail_discover(self: Any, directory: Path) -> None:
+            raise AssertionError("discovery should be served from cache")
+
+        monkeypatch.setattr(DiscoveryCoordinator, "discover_all", fail_discover)
+        result = runner.invoke(
+            app,
+            ["init", "--output", str(output_path), "--dry-run"],
+            catch_exceptions=False,
+        )
+
+        assert result.exit_code == 0
+        assert "make_build" in result.output
+
+    def test_cache_key_changes_with_version(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify results cached by another opencuff release are not reused."""
+        from opencuff.cli import _discovery_cache
+
+        plugins = {"makefile": "opencuff.plugins.builtin.makefile.Plugin"}
+        current = _discovery_cache._cache_path_for(tmp_path, plugins)
+
+        monkeypatch.setattr(_discovery_cache, "__version__", "0.0.0-other")
+        assert _discovery_cache._cache_path_for(tmp_path, plugins) != current
+
+    def test_no_cache_env_skips_discovery_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify OPENCUFF_NO_CACHE neither reads nor writes cached results."""
+        from opencuff.cli._discovery_cache import load_or_discover
+        from opencuff.cli.discovery import DiscoveryCoordinator
+        from opencuff.plugins.builtin.makefile import Plugin as MakefilePlugin
+
+        monkeypatch.setenv("OPENCUFF_NO_CACHE", "1")
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "Makefile").write_text("build:\n\techo build\n")
+        coordinator = DiscoveryCoordinator(
+            plugins={"makefile": MakefilePlugin},
+            module_paths={"makefile": "opencuff.plugins.builtin.makefile"},
+        )
+
+        results = load_or_discover(coordinator, project)
+
+        assert results["makefile"].applicable
+        assert not (tmp_path / "cache").exists()
+
+    def test_cached_results_keep_tuple_fields(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify results served from the cache match freshly discovered ones."""
+        from opencuff.cli._discovery_cache import load_or_discover
+        from opencuff.cli.discovery import DiscoveryCoordinator
+        from opencuff.plugins.builtin.makefile import Plugin as MakefilePlugin
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        (tmp_path / "Makefile").write_text("build:\n\techo build\n")
+        coordinator = DiscoveryCoordinator(
+            plugins={"makefile": MakefilePlugin},
+            module_paths={"makefile": "opencuff.plugins.builtin.makefile"},
+        )
+
+        fresh = load_or_discover(coordinator, tmp_path)
+        cached = load_or_discover(coordinator, tmp_path)
+
+        assert cached == fresh
+        assert isinstance(cached["makefile"].discovered_items, tuple)
+        assert isinstance(cached["makefile"].warnings, tuple)
+
+    def test_init_rescans_after_file_change(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify editing a discovered file invalidates the cache."""
+        from opencuff.cli.main import app
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        project = tmp_path / "project"
+        project.mkdir()
+        makefile = project / "Makefile"
+        makefile.write_text("build:\n\techo build\n")
+        output_path = project / "settings.yml"
+
+        runner = CliRunner()
+        runner.invoke(app, ["init", "--output", str(output_path), "--dry-run"])
+
+        makefile.write_text("build:\n\techo build\n\ndeploy:\n\techo deploy\n")
+        result = runner.invoke(
+            app,
+            ["init", "--output", str(output_path), "--dry-run"],
+            catch_exceptions=False,
+        )
+
+        assert result.exit_code == 0
+        assert "2 targets" in result.output
+
+    def test_init_no_cache_forces_discovery(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify --no-cache runs discovery even when a cache entry exists."""
+        from opencuff.cli.discovery import DiscoveryCoordinator
+        from opencuff.cli.main import app
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "Makefile").write_text("build:\n\techo build\n")
+        output_path = project / "settings.yml"
+
+        runner = CliRunner()
+        runner.invoke(app, ["init", "--output", str(output_path), "--dry-run"])
+
+        calls: list[Path] = []
+        original = DiscoveryCoordinator.discover_all
+
+        def tracking_discover(self: Any, directory: Path) -> Any:
+            calls.append(directory)
+            return original(self, directory)
+
+        monkeypatch.setattr(DiscoveryCoordinator, "discover_all", tracking_discover)
+        result = runner.invoke(
+            app,
+            ["init", "--output", str(output_path), "--dry-run", "--no-cache"],
+            catch_exceptions=False,
+        )
+
+        assert result.exit_code == 0
+        assert len(calls) == 1
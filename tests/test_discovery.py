@@ -2,6 +2,7 @@
 
 Tests cover:
     - DiscoveryResult dataclass creation and defaults
+    - DiscoveryContext directory snapshot
     - CLIArgument, CLIOption, CLICommand dataclasses
     - InSourcePlugin.discover() default implementation
     - InSourcePlugin.get_cli_commands() default implementation
@@ -16,6 +17,7 @@ from opencuff.plugins.base import (
     CLIArgument,
     CLICommand,
     CLIOption,
+    DiscoveryContext,
     DiscoveryResult,
     InSourcePlugin,
     ToolDefinition,
@@ -40,8 +42,8 @@ class TestDiscoveryResult:
         assert result.suggested_config == {"key": "value"}
         assert result.description == "Found something"
 
-    def test_warnings_defaults_to_empty_list(self) -> None:
-        """Verify warnings field defaults to empty list."""
+    def test_warnings_defaults_to_empty_tuple(self) -> None:
+        """Verify warnings field defaults to an empty tuple."""
         result = DiscoveryResult(
             applicable=True,
             confidence=1.0,
@@ -49,10 +51,10 @@ class TestDiscoveryResult:
             description="Test",
         )
 
-        assert result.warnings == []
+        assert result.warnings == ()
 
-    def test_discovered_items_defaults_to_empty_list(self) -> None:
-        """Verify discovered_items field defaults to empty list."""
+    def test_discovered_items_defaults_to_empty_tuple(self) -> None:
+        """Verify discovered_items field defaults to an empty tuple."""
         result = DiscoveryResult(
             applicable=True,
             confidence=1.0,
@@ -60,11 +62,11 @@ class TestDiscoveryResult:
             description="Test",
         )
 
-        assert result.discovered_items == []
+        assert result.discovered_items == ()
 
     def test_warnings_can_be_provided(self) -> None:
-        """Verify warnings can be provided as a list."""
-        warnings = ["Warning 1", "Warning 2"]
+        """Verify warnings can be provided as a tuple."""
+        warnings = ("Warning 1", "Warning 2")
         result = DiscoveryResult(
             applicable=True,
             confidence=0.5,
@@ -73,11 +75,11 @@ class TestDiscoveryResult:
             warnings=warnings,
         )
 
-        assert result.warnings == ["Warning 1", "Warning 2"]
+        assert result.warnings == ("Warning 1", "Warning 2")
 
     def test_discovered_items_can_be_provided(self) -> None:
-        """Verify discovered_items can be provided as a list."""
-        items = ["target1", "target2", "target3"]
+        """Verify discovered_items can be provided as a tuple."""
+        items = ("target1", "target2", "target3")
         result = DiscoveryResult(
             applicable=True,
             confidence=1.0,
@@ -86,7 +88,7 @@ class TestDiscoveryResult:
             discovered_items=items,
         )
 
-        assert result.discovered_items == ["target1", "target2", "target3"]
+        assert result.discovered_items == ("target1", "target2", "target3")
 
     def test_not_applicable_result(self) -> None:
         """Verify a not-applicable result can be created."""
@@ -120,6 +122,52 @@ class TestDiscoveryResult:
         assert result_one.confidence == 1.0
 
 
+class TestDiscoveryContext:
+    """Tests for DiscoveryContext directory snapshot."""
+
+    def test_scan_records_top_level_entries(self, tmp_path: Path) -> None:
+        """Verify scan() records files and directories at the top level."""
+        (tmp_path / "Makefile").touch()
+        (tmp_path / "scripts").mkdir()
+
+        context = DiscoveryContext.scan(tmp_path)
+
+        assert context.top_level_files == frozenset({"Makefile", "scripts"})
+        assert context.exists("Makefile")
+        assert not context.exists("package.json")
+
+    def test_glob_matches_top_level_and_subdirectory(self, tmp_path: Path) -> None:
+        """Verify glob() matches like Path.glob for simple patterns."""
+        (tmp_path / "build.sh").touch()
+        (tmp_path / "README.md").touch()
+        (tmp_path / "scripts").mkdir()
+        (tmp_path / "scripts" / "deploy.sh").touch()
+        (tmp_path / "scripts" / "notes.txt").touch()
+
+        context = DiscoveryContext.scan(tmp_path)
+
+        for pattern in ("*.sh", "scripts/*.sh", "bin/*.sh"):
+            assert sorted(context.glob(pattern)) == sorted(tmp_path.glob(pattern))
+
+    def test_glob_falls_back_for_nested_patterns(self, tmp_path: Path) -> None:
+        """Verify patterns deeper than one level fall back to Path.glob."""
+        nested = tmp_path / "tools" / "ci"
+        nested.mkdir(parents=True)
+        (nested / "check.sh").touch()
+
+        context = DiscoveryContext.scan(tmp_path)
+
+        assert context.glob("tools/ci/*.sh") == [nested / "check.sh"]
+
+    def test_glob_caches_results(self, tmp_path: Path) -> None:
+        """Verify repeated glob() calls reuse the cached result."""
+        (tmp_path / "run.sh").touch()
+
+        context = DiscoveryContext.scan(tmp_path)
+
+        assert context.glob("*.sh") is context.glob("*.sh")
+
+
 class TestCLIArgument:
     """Tests for CLIArgument dataclass."""
 
@@ -74,6 +74,30 @@ class TestDummyPluginTools:
             assert "type" in tool.parameters
             assert "properties" in tool.parameters
 
+    def test_get_tools_shares_definitions(self) -> None:
+        """Verify tool definitions are shared but each call gets its own list."""
+        first = Plugin({}).get_tools()
+        second = Plugin({"prefix": "> "}).get_tools()
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+        first.clear()
+        assert len(Plugin({}).get_tools()) == 3
+
+        with pytest.raises(TypeError):
+            second[0].parameters["required"] = []  # type: ignore[index]
+
+    def test_every_tool_has_a_handler(self) -> None:
+        """Verify the dispatch table covers exactly the declared tools."""
+        plugin = Plugin({})
+
+        tool_names = {tool.name for tool in plugin.get_tools()}
+
+        assert set(Plugin._TOOL_HANDLERS) == tool_names
+        for handler_name in Plugin._TOOL_HANDLERS.values():
+            assert callable(getattr(plugin, handler_name))
+
 
 class TestEchoTool:
     """Tests for the echo tool."""
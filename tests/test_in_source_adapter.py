@@ -9,6 +9,11 @@ Tests cover:
     - Error handling
 """
 
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
 import pytest
 
 from opencuff.plugins.adapters.in_source import InSourceAdapter
@@ -168,6 +173,47 @@ class TestInSourceAdapterPluginClassValidation:
 
         await adapter.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_adapters_sharing_module_use_same_class(self) -> None:
+        """Verify adapters loading the same module resolve the same class."""
+        first = InSourceAdapter(
+            name="first",
+            module_path="opencuff.plugins.builtin.dummy",
+        )
+        second = InSourceAdapter(
+            name="second",
+            module_path="opencuff.plugins.builtin.dummy",
+        )
+
+        await first.initialize({})
+        await second.initialize({})
+
+        assert type(first._plugin) is type(second._plugin)
+
+        await first.shutdown()
+        await second.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rebound_plugin_class_is_revalidated(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify a class rebound in the module is not served from the cache."""
+        import opencuff.plugins.builtin.dummy as dummy_module
+
+        adapter = InSourceAdapter(
+            name="dummy",
+            module_path="opencuff.plugins.builtin.dummy",
+        )
+        await adapter.initialize({})
+        await adapter.shutdown()
+
+        monkeypatch.setattr(dummy_module, "Plugin", object)
+
+        with pytest.raises(PluginError) as exc_info:
+            await adapter.initialize({})
+
+        assert exc_info.value.code == PluginErrorCode.LOAD_FAILED
+
 
 class TestInSourceAdapterToolRetrieval:
     """Tests for tool retrieval functionality."""
@@ -383,6 +429,138 @@ class TestInSourceAdapterReload:
 
         assert exc_info.value.code == PluginErrorCode.PLUGIN_UNHEALTHY
 
+    # Plugin module written to a temporary directory, so tests control both
+    # when it is first imported and when its source changes
+    _RELOAD_MODULE_SOURCE = """
+from opencuff.plugins.base import InSourcePlugin, ToolDefinition, ToolResult
+
+VERSION = {version!r}
+
+
+class Plugin(InSourcePlugin):
+    def get_tools(self):
+        return [ToolDefinition(name="version", description=VERSION)]
+
+    async def call_tool(self, tool_name, arguments):
+        return ToolResult(success=True, data=VERSION)
+"""
+
+    @pytest.fixture
+    def reload_module(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> Iterator[tuple[str, Path]]:
+        """Create an importable plugin module and remove it afterwards."""
+        from opencuff.plugins.adapters import in_source
+
+        name = f"reload_plugin_{tmp_path.name}"
+        source_path = tmp_path / f"{name}.py"
+        source_path.write_text(self._RELOAD_MODULE_SOURCE.format(version="v1"))
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setattr(sys, "dont_write_bytecode", True)
+        yield name, source_path
+        sys.modules.pop(name, None)
+        in_source._module_stamps.pop(name, None)
+
+    def _edit_module(self, source_path: Path, version: str) -> None:
+        """Rewrite the module source with a new version and a newer mtime."""
+        st = source_path.stat()
+        source_path.write_text(self._RELOAD_MODULE_SOURCE.format(version=version))
+        os.utime(source_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    def _adapter(self, name: str) -> InSourceAdapter:
+        """Create an adapter for the temporary plugin module."""
+        return InSourceAdapter(
+            name="reloadable",
+            module_path=name,
+            allowed_prefixes=[name],
+        )
+
+    @pytest.mark.asyncio
+    async def test_reload_module_skips_unchanged_module(
+        self, reload_module: tuple[str, Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify reload_module() doesn't re-execute an unchanged module."""
+        import importlib
+
+        name, _ = reload_module
+        adapter = self._adapter(name)
+        await adapter.initialize({})
+        old_plugin = adapter._plugin
+
+        def fail_reload(module):
+            raise AssertionError("unchanged module should not be reloaded")
+
+        monkeypatch.setattr(importlib, "reload", fail_reload)
+
+        await adapter.reload_module()
+
+        # The plugin is still re-instantiated
+        assert adapter._plugin is not None
+        assert adapter._plugin is not old_plugin
+
+        await adapter.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_reload_module_reloads_changed_module(
+        self, reload_module: tuple[str, Path]
+    ) -> None:
+        """Verify reload_module() re-executes a module whose file changed."""
+        name, source_path = reload_module
+        adapter = self._adapter(name)
+        await adapter.initialize({})
+        self._edit_module(source_path, "v2")
+
+        await adapter.reload_module()
+
+        tools = await adapter.get_tools()
+        assert tools[0].description == "v2"
+
+        await adapter.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_reload_module_reloads_module_edited_after_shared_import(
+        self, reload_module: tuple[str, Path]
+    ) -> None:
+        """Verify a module imported elsewhere and then edited is re-executed.
+
+        The second adapter gets the already-imported module from
+        sys.modules, so the file it sees is newer than the code it runs.
+        """
+        name, source_path = reload_module
+        first = self._adapter(name)
+        await first.initialize({})
+        self._edit_module(source_path, "v2")
+
+        second = self._adapter(name)
+        await second.initialize({})
+        assert (await second.get_tools())[0].description == "v1"
+
+        await second.reload_module()
+
+        assert (await second.get_tools())[0].description == "v2"
+
+        await first.shutdown()
+        await second.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_reload_module_reloads_module_imported_outside_adapters(
+        self, reload_module: tuple[str, Path]
+    ) -> None:
+        """Verify a module no adapter imported is never assumed unchanged."""
+        import importlib
+
+        name, source_path = reload_module
+        importlib.import_module(name)
+        self._edit_module(source_path, "v2")
+
+        adapter = self._adapter(name)
+        await adapter.initialize({})
+        await adapter.reload_module()
+
+        assert (await adapter.get_tools())[0].description == "v2"
+
+        await adapter.shutdown()
+
 
 class TestInSourceAdapterConfigMerging:
     """Tests for configuration merging behavior."""
@@ -58,7 +58,7 @@ class TestDiscover:
 
         result = Plugin.discover(tmp_path)
 
-        assert isinstance(result.discovered_items, list)
+        assert isinstance(result.discovered_items, tuple)
         assert len(result.discovered_items) > 0
         # Check that we get tool names with make_ prefix
         for item in result.discovered_items:
@@ -195,9 +195,26 @@ class TestDiscover:
         assert result.applicable is True
         assert result.confidence == 1.0
         # Should still have the list_targets tool
-        assert result.discovered_items == ["make_list_targets"]
+        assert result.discovered_items == ("make_list_targets",)
         assert "0" in result.description  # 0 targets
 
+    def test_discover_reparses_modified_makefile(self, tmp_path: Path) -> None:
+        """Verify cached discovery results are refreshed when the file changes."""
+        makefile = tmp_path / "Makefile"
+        makefile.write_text("build:\n\t@echo build\n")
+
+        first = Plugin.discover(tmp_path)
+        assert first.discovered_items == ("make_list_targets", "make_build")
+
+        makefile.write_text("build:\n\t@echo build\n\ntest:\n\t@echo test\n")
+
+        second = Plugin.discover(tmp_path)
+        assert second.discovered_items == (
+            "make_list_targets",
+            "make_build",
+            "make_test",
+        )
+
 
 # =============================================================================
 # TestGetCLICommands
@@ -684,6 +684,37 @@ class TestTargetFilter:
         assert filter.matches("test-1") is False
         assert filter.matches("test-9") is False
 
+    def test_regex_metacharacters_are_literal(self) -> None:
+        """Verify regex syntax in patterns is matched literally."""
+        filter = TargetFilter(["build.all", "a|b", "x+"], [])
+
+        assert filter.matches("build.all") is True
+        assert filter.matches("buildxall") is False
+        assert filter.matches("a|b") is True
+        assert filter.matches("a") is False
+        assert filter.matches("x+") is True
+        assert filter.matches("xx") is False
+
+    def test_literal_and_wildcard_patterns_combine(self) -> None:
+        """Verify plain names and wildcards in one list both apply."""
+        filter = TargetFilter(["build", "test-*", "odd[name"], ["test-slow", "*-wip"])
+
+        assert filter.matches("build") is True
+        assert filter.matches("test-unit") is True
+        assert filter.matches("odd[name") is True
+        assert filter.matches("test-slow") is False
+        assert filter.matches("build-wip") is False
+        assert filter.matches("builds") is False
+
+    def test_matching_is_case_sensitive(self) -> None:
+        """Verify target names are matched case-sensitively."""
+        filter = TargetFilter(["Build-*"], ["*-DEBUG"])
+
+        assert filter.matches("Build-release") is True
+        assert filter.matches("build-release") is False
+        assert filter.matches("Build-DEBUG") is False
+        assert filter.matches("Build-debug") is True
+
     def test_from_config(self) -> None:
         """Verify filter creation from config."""
         config = MakefilePluginConfig(
@@ -71,7 +71,7 @@ class TestPackageJsonDiscovery:
         desc = result.description.lower()
         assert "not found" in desc or "no package.json" in desc
         assert result.suggested_config == {}
-        assert result.discovered_items == []
+        assert result.discovered_items == ()
 
     def test_discover_with_empty_scripts(self) -> None:
         """Verify discover() handles package.json with no scripts."""
@@ -81,7 +81,7 @@ class TestPackageJsonDiscovery:
         assert result.confidence == 1.0
         assert "0 scripts" in result.description
         # Should still have the list_scripts tool
-        assert result.discovered_items == ["npm_list_scripts"]
+        assert result.discovered_items == ("npm_list_scripts",)
 
     def test_discover_with_complex_scripts(self) -> None:
         """Verify discover() finds all scripts in complex package.json."""
@@ -14,6 +14,7 @@ from opencuff.plugins.base import (
     PluginState,
     ToolDefinition,
     ToolResult,
+    freeze_schemas,
 )
 
 
@@ -71,6 +72,60 @@ class TestToolDefinition:
 
         assert tool1 == tool2
 
+    def test_tool_definition_is_hashable(self) -> None:
+        """Verify tool definitions with schema dicts can be used in sets."""
+        tool1 = ToolDefinition(
+            name="echo",
+            description="Echo input",
+            parameters={"type": "object"},
+        )
+        tool2 = ToolDefinition(
+            name="echo",
+            description="Echo input",
+            parameters={"type": "object"},
+        )
+
+        assert hash(tool1) == hash(tool2)
+        assert len({tool1, tool2}) == 1
+
+    def test_tool_definition_construction_stays_cheap(self) -> None:
+        """Verify construction only assigns slots, with no freeze or copy step."""
+        assert not ToolDefinition.__dataclass_params__.frozen  # type: ignore[attr-defined]
+        assert not hasattr(ToolDefinition, "__post_init__")
+        assert not hasattr(ToolDefinition(name="a", description="A"), "__dict__")
+
+        params = {"type": "object"}
+        assert (
+            ToolDefinition(name="a", description="A", parameters=params).parameters
+            is params
+        )
+
+    def test_default_schemas_are_empty_and_read_only(self) -> None:
+        """Verify omitted schemas default to a shared read-only empty mapping."""
+        tool1 = ToolDefinition(name="a", description="A")
+        tool2 = ToolDefinition(name="b", description="B")
+
+        assert tool1.parameters == {}
+        assert tool1.returns == {}
+        assert tool1.parameters is tool2.parameters
+        with pytest.raises(TypeError):
+            tool1.parameters["type"] = "object"  # type: ignore[index]
+
+    def test_freeze_schemas_returns_read_only_copy(self) -> None:
+        """Verify freeze_schemas() copies the schemas into read-only mappings."""
+        params = {"type": "object", "required": ["message"]}
+        tool = ToolDefinition(name="echo", description="Echo", parameters=params)
+
+        frozen = freeze_schemas(tool)
+
+        assert frozen == tool
+        assert frozen.parameters["required"] == ["message"]
+        with pytest.raises(TypeError):
+            frozen.parameters["type"] = "string"  # type: ignore[index]
+        params["type"] = "string"
+        assert frozen.parameters["type"] == "object"
+        assert freeze_schemas(ToolDefinition(name="a", description="A")).returns == {}
+
 
 class TestToolResult:
     """Tests for ToolResult dataclass."""
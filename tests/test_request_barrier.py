@@ -30,6 +30,23 @@ class TestRequestScope:
 
         # Should complete without error
 
+    @pytest.mark.asyncio
+    async def test_request_scope_skips_wait_when_not_reloading(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify requests don't go through wait_for when no reload is active."""
+        barrier = RequestBarrier()
+
+        async def fail_wait_for(*args, **kwargs):
+            raise AssertionError("wait_for should not be called")
+
+        monkeypatch.setattr(asyncio, "wait_for", fail_wait_for)
+
+        async with barrier.request_scope():
+            assert barrier.active_requests == 1
+
+        assert barrier.active_requests == 0
+
     @pytest.mark.asyncio
     async def test_request_scope_tracks_active_requests(self) -> None:
         """Verify active request count is tracked."""
@@ -149,6 +166,38 @@ class TestReloadScope:
         # Now reload should have completed
         assert reload_completed.is_set()
 
+    @pytest.mark.asyncio
+    async def test_reload_waits_for_last_of_several_requests(self) -> None:
+        """Verify reload only proceeds once every in-flight request is done."""
+        barrier = RequestBarrier()
+        release = [asyncio.Event(), asyncio.Event()]
+        started = asyncio.Event()
+        reload_completed = asyncio.Event()
+
+        async def request(gate: asyncio.Event) -> None:
+            async with barrier.request_scope():
+                started.set()
+                await gate.wait()
+
+        async def do_reload() -> None:
+            async with barrier.reload_scope():
+                reload_completed.set()
+
+        request_tasks = [asyncio.create_task(request(gate)) for gate in release]
+        await started.wait()
+        await asyncio.sleep(0)
+        reload_task = asyncio.create_task(do_reload())
+
+        release[0].set()
+        await asyncio.sleep(0.05)
+        assert not reload_completed.is_set()
+
+        release[1].set()
+        await asyncio.gather(*request_tasks, reload_task)
+
+        assert reload_completed.is_set()
+        assert barrier.active_requests == 0
+
     @pytest.mark.asyncio
     async def test_requests_resume_after_reload(self) -> None:
         """Verify requests can proceed after reload completes."""